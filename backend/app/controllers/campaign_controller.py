@@ -3,83 +3,187 @@ Campaign Controller - HTTP request/response handling for Campaign endpoints.
 Handles authentication, authorization, and HTTP-specific logic.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet, Literal, Tuple
 from uuid import UUID
 from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
 from app.services.campaign_service import CampaignService
 from app.schemas.campaign import (
     CampaignCreate, CampaignUpdate, CampaignResponse,
-    CampaignFilter, CampaignWithStats, AddToCampaignRequest,
+    CampaignFilter, CampaignWithStats, CampaignSummary, AddToCampaignRequest,
     CampaignExecuteRequest
 )
 from app.models.user import UserProfile
 from app.models.campaign import CampaignStatus, CampaignType, Campaign
-from app.core.auth_helpers import (
-    get_campaigns_query_filter,
-    check_campaign_edit_permission,
-    check_campaign_delete_permission
+from app.models.campaign_contact import EngagementStatus
+from app.core.auth import get_user_permission_set
+from app.core.auth_helpers import get_campaigns_query_filter
+from app.core.query_filters import parse_csv_enum
+
+# Response fields read directly off the Campaign row (columns and calculated properties)
+CAMPAIGN_FIELDS = tuple(
+    field for field in CampaignWithStats.model_fields if field != 'email_template_name'
 )
-from app.core.auth import has_permission
+
+# Lookup tables for comma-separated enum query filters
+_CAMPAIGN_STATUS_MAP = {s.value: s for s in CampaignStatus}
+_CAMPAIGN_TYPE_MAP = {t.value: t for t in CampaignType}
+_ENGAGEMENT_STATUS_MAP = {s.value: s for s in EngagementStatus}
+
+# Upper bounds for caller-supplied page sizes and analytics windows (match the route limits)
+MAX_PAGE_SIZE = 500
+MAX_ANALYTICS_DAYS = 365
+
+
+def _clamp_page(skip: int, limit: int) -> Tuple[int, int]:
+    """Clamp pagination parameters to a non-negative offset and a bounded page size."""
+    return max(skip, 0), min(max(limit, 1), MAX_PAGE_SIZE)
+
+
+def _clamp_days(days: int) -> int:
+    """Clamp an analytics time window to between one day and MAX_ANALYTICS_DAYS."""
+    return min(max(days, 1), MAX_ANALYTICS_DAYS)
+
+
+def _is_owner(campaign: Campaign, user: UserProfile) -> bool:
+    """Check campaign ownership; both ids are UUID columns, so compare them directly."""
+    return campaign.owner_id == user.id
 
 
 class CampaignController:
-    """Controller for handling campaign HTTP requests."""
+    """
+    Controller for handling campaign HTTP requests.
+
+    The service layer uses a synchronous SQLAlchemy session, so every call
+    into it is dispatched with run_in_threadpool to keep the event loop free.
+    """
 
     def __init__(self, db: Session):
         self.db = db
         self.service = CampaignService(db)
+        # Controllers are built per request, so the permission set lives for one request
+        self._perms: Optional[FrozenSet[str]] = None
+
+    async def _has_perm(self, user: UserProfile, permission_name: str) -> bool:
+        """Check a permission against the lazily loaded per-request permission set."""
+        perms = self._perms
+        if perms is None:
+            perms = self._perms = await run_in_threadpool(get_user_permission_set, self.db, user)
+        return permission_name in perms
+
+    async def _get_authorized_campaign(
+        self,
+        campaign_id: UUID,
+        current_user: UserProfile,
+        action: Literal["view", "edit", "delete", "execute"],
+        with_template: bool = False,
+        edit_verb: str = "modify"
+    ) -> Campaign:
+        """
+        Load a campaign and verify the user may perform the given action on it.
+
+        Args:
+            campaign_id: Campaign UUID
+            current_user: Authenticated user
+            action: One of "view", "edit", "delete" or "execute"
+            with_template: Eager-load the email template alongside the campaign
+            edit_verb: Verb used in the "edit" denial message ("modify" or "edit")
+
+        Returns:
+            The campaign
+
+        Raises:
+            HTTPException: If campaign not found or access denied
+        """
+        if with_template:
+            campaign = await run_in_threadpool(self.service.get_campaign_with_template, campaign_id)
+        else:
+            campaign = await run_in_threadpool(self.service.get_campaign, campaign_id)
+
+        if not campaign:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Campaign not found"
+            )
+
+        is_owner = _is_owner(campaign, current_user)
+
+        if action == "edit":
+            # Edit permission (edit_all OR edit_own with ownership)
+            if not (await self._has_perm(current_user, "campaigns.edit_all") or
+                    (await self._has_perm(current_user, "campaigns.edit_own") and is_owner)):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail=f"Permission denied. You don't have permission to {edit_verb} this campaign."
+                )
+            return campaign
+
+        if action == "delete":
+            # Delete permission (delete_all OR delete_own with ownership)
+            if not (await self._has_perm(current_user, "campaigns.delete_all") or
+                    (await self._has_perm(current_user, "campaigns.delete_own") and is_owner)):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Permission denied. You don't have permission to delete this campaign."
+                )
+            return campaign
+
+        if action == "execute" and not await self._has_perm(current_user, "campaigns.execute"):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Permission denied. You don't have permission to execute campaigns."
+            )
+
+        # View (and execute) require view_all OR (view_own AND ownership)
+        can_view_all = await self._has_perm(current_user, "campaigns.view_all")
+        can_view_own = await self._has_perm(current_user, "campaigns.view_own")
+
+        if not can_view_all and not (can_view_own and is_owner):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=f"Not authorized to {'execute' if action == 'execute' else 'access'} this campaign"
+            )
+
+        return campaign
 
     async def get_campaigns(
         self,
         current_user: UserProfile,
-        status: Optional[str] = None,
-        type: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        type_filter: Optional[str] = None,
         search: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        summary: bool = False
     ) -> Dict[str, Any]:
         """
         Get campaigns with filters and permission-based access.
 
         Args:
             current_user: Authenticated user
-            status: Status filter (comma-separated)
-            type: Type filter (comma-separated)
+            status_filter: Status filter (comma-separated)
+            type_filter: Type filter (comma-separated)
             search: Search term
             skip: Pagination offset
             limit: Pagination limit
+            summary: Return lightweight rows without stats or template name
 
         Returns:
             Dictionary with campaigns and total count
         """
-        # Parse filters
-        status_list = None
-        if status:
-            try:
-                status_list = [CampaignStatus(s.strip()) for s in status.split(',') if s.strip()]
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid status value"
-                )
+        skip, limit = _clamp_page(skip, limit)
 
-        type_list = None
-        if type:
-            try:
-                type_list = [CampaignType(t.strip()) for t in type.split(',') if t.strip()]
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid type value"
-                )
+        # Parse filters
+        status_list = parse_csv_enum(status_filter, _CAMPAIGN_STATUS_MAP, "status") if status_filter else None
+        type_list = parse_csv_enum(type_filter, _CAMPAIGN_TYPE_MAP, "type") if type_filter else None
 
         # Apply permission-based filtering
         # If user has view_all, they see all campaigns
         # If user has view_own, they see only their own campaigns
         owner_id = None
-        if not has_permission(self.db, current_user, "campaigns.view_all"):
+        if not await self._has_perm(current_user, "campaigns.view_all"):
             # User can only see their own campaigns
             owner_id = current_user.id
 
@@ -91,16 +195,32 @@ class CampaignController:
             owner_id=owner_id
         )
 
-        campaigns, total = self.service.get_campaigns(
+        if summary:
+            rows, total = await run_in_threadpool(
+                self.service.get_campaign_summaries,
+                filters=campaign_filter,
+                skip=skip,
+                limit=limit
+            )
+
+            return {
+                "campaigns": [CampaignSummary.model_construct(**row._mapping) for row in rows],
+                "total": total,
+                "skip": skip,
+                "limit": limit
+            }
+
+        campaigns, total = await run_in_threadpool(
+            self.service.get_campaigns,
             filters=campaign_filter,
             skip=skip,
             limit=limit
         )
 
-        # Convert to response models
-        campaign_responses = [
-            self._build_campaign_with_stats(c) for c in campaigns
-        ]
+        # Convert to response models (may lazy-load email templates, so stay off the loop)
+        campaign_responses = await run_in_threadpool(
+            lambda: [self._build_campaign_with_stats(c) for c in campaigns]
+        )
 
         return {
             "campaigns": campaign_responses,
@@ -127,24 +247,9 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check permissions: user needs view_all OR (view_own AND ownership)
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
-
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this campaign"
-            )
+        campaign = await self._get_authorized_campaign(
+            campaign_id, current_user, "view", with_template=True
+        )
 
         return self._build_campaign_with_stats(campaign)
 
@@ -167,13 +272,14 @@ class CampaignController:
             HTTPException: If user doesn't have permission to create campaigns
         """
         # Check campaigns.create permission
-        if not has_permission(self.db, current_user, "campaigns.create"):
+        if not await self._has_perm(current_user, "campaigns.create"):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Permission denied. You don't have permission to create campaigns."
             )
 
-        campaign = self.service.create_campaign(
+        campaign = await run_in_threadpool(
+            self.service.create_campaign,
             campaign_data=campaign_data,
             created_by=current_user.id
         )
@@ -200,22 +306,10 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check edit permission (edit_all OR edit_own with ownership)
-        if not check_campaign_edit_permission(self.db, current_user, campaign):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to edit this campaign."
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "edit", edit_verb="edit")
 
-        updated_campaign = self.service.update_campaign(
+        updated_campaign = await run_in_threadpool(
+            self.service.update_campaign,
             campaign_id=campaign_id,
             campaign_data=campaign_data
         )
@@ -246,22 +340,9 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check delete permission (delete_all OR delete_own with ownership)
-        if not check_campaign_delete_permission(self.db, current_user, campaign):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to delete this campaign."
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "delete")
 
-        success = self.service.delete_campaign(campaign_id)
+        success = await run_in_threadpool(self.service.delete_campaign, campaign_id)
 
         if not success:
             raise HTTPException(
@@ -291,22 +372,10 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check edit permission (modifying audience requires edit permission)
-        if not check_campaign_edit_permission(self.db, current_user, campaign):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to modify this campaign."
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "edit")
 
-        return self.service.add_audience_to_campaign(
+        return await run_in_threadpool(
+            self.service.add_audience_to_campaign,
             campaign_id=campaign_id,
             audience_request=audience_request
         )
@@ -315,7 +384,7 @@ class CampaignController:
         self,
         campaign_id: UUID,
         current_user: UserProfile,
-        status: Optional[str] = None,
+        status_filter: Optional[str] = None,
         skip: int = 0,
         limit: int = 100
     ) -> Dict[str, Any]:
@@ -325,7 +394,7 @@ class CampaignController:
         Args:
             campaign_id: Campaign UUID
             current_user: Authenticated user
-            status: Optional engagement status filter
+            status_filter: Optional engagement status filter
             skip: Pagination offset
             limit: Pagination limit
 
@@ -335,38 +404,13 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check view permissions
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
+        skip, limit = _clamp_page(skip, limit)
+        await self._get_authorized_campaign(campaign_id, current_user, "view")
 
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this campaign"
-            )
+        status_list = parse_csv_enum(status_filter, _ENGAGEMENT_STATUS_MAP, "status") if status_filter else None
 
-        # Parse status filter
-        from app.models.campaign_contact import EngagementStatus
-        status_list = None
-        if status:
-            try:
-                status_list = [EngagementStatus(s.strip()) for s in status.split(',') if s.strip()]
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid status value"
-                )
-
-        audience = self.service.get_campaign_audience(
+        audience, total = await run_in_threadpool(
+            self.service.get_campaign_audience,
             campaign_id=campaign_id,
             status=status_list,
             skip=skip,
@@ -376,7 +420,9 @@ class CampaignController:
         return {
             "campaign_id": campaign_id,
             "audience": audience,
-            "total": len(audience)
+            "total": total,
+            "skip": skip,
+            "limit": limit
         }
 
     async def remove_audience_member(
@@ -399,22 +445,10 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "edit")
 
-        # Check edit permission (modifying audience requires edit permission)
-        if not check_campaign_edit_permission(self.db, current_user, campaign):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to modify this campaign."
-            )
-
-        return self.service.remove_audience_member(
+        return await run_in_threadpool(
+            self.service.remove_audience_member,
             campaign_id=campaign_id,
             campaign_contact_id=campaign_contact_id
         )
@@ -439,33 +473,10 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check execute permission
-        if not has_permission(self.db, current_user, "campaigns.execute"):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to execute campaigns."
-            )
-
-        # Also check that user can access this campaign (view permission)
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
+        await self._get_authorized_campaign(campaign_id, current_user, "execute")
 
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to execute this campaign"
-            )
-
-        return self.service.execute_campaign(
+        return await run_in_threadpool(
+            self.service.execute_campaign,
             campaign_id=campaign_id,
             execute_request=execute_request,
             executed_by=current_user.id
@@ -489,33 +500,10 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check execute permission
-        if not has_permission(self.db, current_user, "campaigns.execute"):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to execute campaigns."
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "execute")
 
-        # Check campaign access
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
-
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to execute this campaign"
-            )
-
-        return self.service.send_to_pending_audience(
+        return await run_in_threadpool(
+            self.service.send_to_pending_audience,
             campaign_id=campaign_id,
             executed_by=current_user.id
         )
@@ -540,33 +528,10 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check execute permission (resending requires execute permission)
-        if not has_permission(self.db, current_user, "campaigns.execute"):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to execute campaigns."
-            )
-
-        # Check campaign access
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
-
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to execute this campaign"
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "execute")
 
-        return self.service.resend_to_member(
+        return await run_in_threadpool(
+            self.service.resend_to_member,
             campaign_id=campaign_id,
             campaign_contact_id=campaign_contact_id,
             executed_by=current_user.id
@@ -590,31 +555,16 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check view permissions
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
-
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this campaign"
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "view")
 
-        return self.service.get_campaign_metrics(campaign_id)
+        return await run_in_threadpool(self.service.get_campaign_metrics, campaign_id)
 
     async def get_conversions(
         self,
         campaign_id: UUID,
-        current_user: UserProfile
+        current_user: UserProfile,
+        skip: int = 0,
+        limit: int = 100
     ) -> Dict[str, Any]:
         """
         Get campaign conversions (deals).
@@ -622,6 +572,8 @@ class CampaignController:
         Args:
             campaign_id: Campaign UUID
             current_user: Authenticated user
+            skip: Pagination offset
+            limit: Pagination limit
 
         Returns:
             Conversion data
@@ -629,31 +581,22 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check view permissions
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
+        skip, limit = _clamp_page(skip, limit)
+        await self._get_authorized_campaign(campaign_id, current_user, "view")
 
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this campaign"
-            )
-
-        conversions = self.service.get_campaign_conversions(campaign_id)
+        conversions, total = await run_in_threadpool(
+            self.service.get_campaign_conversions,
+            campaign_id,
+            skip=skip,
+            limit=limit
+        )
 
         return {
             "campaign_id": campaign_id,
             "conversions": conversions,
-            "total": len(conversions)
+            "total": total,
+            "skip": skip,
+            "limit": limit
         }
 
     async def get_analytics(
@@ -676,26 +619,39 @@ class CampaignController:
         Raises:
             HTTPException: If campaign not found or access denied
         """
-        campaign = self.service.get_campaign(campaign_id)
+        days = _clamp_days(days)
+        await self._get_authorized_campaign(campaign_id, current_user, "view")
 
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
+        return await run_in_threadpool(self.service.get_campaign_analytics, campaign_id, days)
 
-        # Check view permissions
-        can_view_all = has_permission(self.db, current_user, "campaigns.view_all")
-        can_view_own = has_permission(self.db, current_user, "campaigns.view_own")
-        is_owner = str(campaign.owner_id) == str(current_user.id)
+    async def get_dashboard(
+        self,
+        campaign_id: UUID,
+        current_user: UserProfile,
+        days: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Get metrics, analytics and conversions for a campaign dashboard.
 
-        if not can_view_all and not (can_view_own and is_owner):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this campaign"
-            )
+        Authorizes and loads the campaign once, then builds the whole payload
+        in a single worker thread; the request session is not safe to share
+        across concurrent threads, so the queries run back to back there.
+
+        Args:
+            campaign_id: Campaign UUID
+            current_user: Authenticated user
+            days: Number of days for time-series data
+
+        Returns:
+            Dashboard data
+
+        Raises:
+            HTTPException: If campaign not found or access denied
+        """
+        days = _clamp_days(days)
+        await self._get_authorized_campaign(campaign_id, current_user, "view")
 
-        return self.service.get_campaign_analytics(campaign_id, days)
+        return await run_in_threadpool(self.service.get_campaign_dashboard, campaign_id, days)
 
     async def get_statistics(
         self,
@@ -712,10 +668,10 @@ class CampaignController:
         """
         # If user has view_all, get all statistics; otherwise, only their own
         owner_id = None
-        if not has_permission(self.db, current_user, "campaigns.view_all"):
+        if not await self._has_perm(current_user, "campaigns.view_all"):
             owner_id = current_user.id
 
-        return self.service.get_campaign_statistics(owner_id=owner_id)
+        return await run_in_threadpool(self.service.get_campaign_statistics, owner_id=owner_id)
 
     async def link_deal_to_campaign(
         self,
@@ -738,49 +694,20 @@ class CampaignController:
         Returns:
             Success message
         """
-        campaign = self.service.get_campaign(campaign_id)
-
-        if not campaign:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Campaign not found"
-            )
-
-        # Check edit permission (linking deals requires edit permission)
-        if not check_campaign_edit_permission(self.db, current_user, campaign):
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Permission denied. You don't have permission to modify this campaign."
-            )
+        await self._get_authorized_campaign(campaign_id, current_user, "edit")
 
-        return self.service.link_deal_to_campaign(
+        return await run_in_threadpool(
+            self.service.link_deal_to_campaign,
             campaign_id=campaign_id,
             prospect_id=prospect_id,
             deal_id=deal_id,
             conversion_value=conversion_value
         )
 
-    def _build_campaign_with_stats(self, campaign) -> Dict[str, Any]:
+    def _build_campaign_with_stats(self, campaign) -> CampaignWithStats:
         """Build campaign response with calculated stats."""
-        campaign_dict = CampaignResponse.from_orm(campaign).dict()
-
-        # Add calculated properties
-        campaign_dict['roi'] = campaign.roi
-        campaign_dict['open_rate'] = campaign.open_rate
-        campaign_dict['click_rate'] = campaign.click_rate
-        campaign_dict['response_rate'] = campaign.response_rate
-        campaign_dict['conversion_rate'] = campaign.conversion_rate
-        campaign_dict['delivery_rate'] = campaign.delivery_rate
-        campaign_dict['bounce_rate'] = campaign.bounce_rate
-        campaign_dict['days_remaining'] = campaign.days_remaining
-        campaign_dict['is_active'] = campaign.is_active
-        campaign_dict['is_scheduled'] = campaign.is_scheduled
-        campaign_dict['is_draft'] = campaign.is_draft
-
-        # Add email template name if available
-        if campaign.email_template:
-            campaign_dict['email_template_name'] = campaign.email_template.name
-        else:
-            campaign_dict['email_template_name'] = None
+        data = {field: getattr(campaign, field) for field in CAMPAIGN_FIELDS}
+        data['email_template_name'] = campaign.email_template.name if campaign.email_template else None
 
-        return campaign_dict
+        # Values come straight from the ORM row, so skip re-validation
+        return CampaignWithStats.model_construct(**data)
@@ -3,9 +3,14 @@ Integration Controller - HTTP handling layer for Integration operations.
 Manages request/response, permissions, and error handling.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Dict, Any, Optional
 from uuid import UUID
-from fastapi import HTTPException, status
+from datetime import datetime
+from threading import Lock
+import orjson
+from cachetools import TTLCache
+from fastapi import HTTPException, status, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ..services.integration_service_new import IntegrationService
@@ -16,6 +21,24 @@ from ..schemas.integration import (
     IntegrationUpdate,
     IntegrationLogResponse
 )
+from ..schemas.orm import orm_to_dict, orm_list_to_dicts, orm_to_response
+from ..core.http_cache import weak_etag, etag_matches, not_modified
+
+# Provider metadata is static, so serialize it once at import
+_SUPPORTED_PROVIDERS_JSON = orjson.dumps(IntegrationService.SUPPORTED_PROVIDERS)
+
+# Per-process cache for the aggregate statistics endpoints, keyed by
+# (kind, user_id, ...). Entries for a user are dropped whenever one of their
+# integrations changes, so the TTL only bounds staleness from background syncs.
+_STATS_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+_STATS_CACHE_LOCK = Lock()
+
+
+def _invalidate_user_stats(user_id: UUID) -> None:
+    """Drop every cached statistics entry belonging to a user."""
+    with _STATS_CACHE_LOCK:
+        for key in [key for key in _STATS_CACHE if key[1] == user_id]:
+            _STATS_CACHE.pop(key, None)
 
 
 class IntegrationController:
@@ -29,7 +52,7 @@ class IntegrationController:
         self,
         current_user: UserProfile,
         include_logs: bool = False
-    ) -> List[IntegrationResponse]:
+    ) -> ORJSONResponse:
         """
         Get all integrations for the current user.
 
@@ -38,32 +61,50 @@ class IntegrationController:
             include_logs: Whether to include logs
 
         Returns:
-            List of integration responses
+            JSON response with the list of integrations
         """
         integrations = self.service.get_all_integrations(
             current_user.id,
             include_logs
         )
-        return [IntegrationResponse.model_validate(i) for i in integrations]
+        # trusted DB source, serialized straight to JSON
+        return ORJSONResponse(
+            content=orm_list_to_dicts(IntegrationResponse, integrations)
+        )
 
     def get_integration(
         self,
         integration_id: UUID,
-        current_user: UserProfile
-    ) -> IntegrationResponse:
+        current_user: UserProfile,
+        if_none_match: Optional[str] = None
+    ) -> Response:
         """
         Get a specific integration.
 
+        When the client sends If-None-Match, only updated_at is fetched first
+        and an unchanged integration is answered with 304 Not Modified.
+
         Args:
             integration_id: Integration UUID
             current_user: Authenticated user
+            if_none_match: Optional If-None-Match header value
 
         Returns:
-            Integration response
+            JSON response with an ETag header, or an empty 304 response
 
         Raises:
             HTTPException: If not found or access denied
         """
+        if if_none_match:
+            version = self.service.get_integration_version(
+                integration_id,
+                current_user.id
+            )
+            if version is not None:
+                etag = weak_etag(integration_id, version.updated_at)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
         integration = self.service.get_integration_by_id(
             integration_id,
             current_user.id
@@ -75,7 +116,10 @@ class IntegrationController:
                 detail="Integration not found"
             )
 
-        return IntegrationResponse.model_validate(integration)
+        return ORJSONResponse(
+            content=orm_to_dict(IntegrationResponse, integration),
+            headers={"ETag": weak_etag(integration.id, integration.updated_at)}
+        )
 
     def get_integration_by_provider(
         self,
@@ -100,7 +144,7 @@ class IntegrationController:
         if not integration:
             return None
 
-        return IntegrationResponse.model_validate(integration)
+        return orm_to_response(IntegrationResponse, integration)
 
     def create_integration(
         self,
@@ -125,7 +169,8 @@ class IntegrationController:
                 integration_data,
                 current_user.id
             )
-            return IntegrationResponse.model_validate(integration)
+            _invalidate_user_stats(current_user.id)
+            return orm_to_response(IntegrationResponse, integration)
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -158,6 +203,7 @@ class IntegrationController:
                 integration_data,
                 current_user.id
             )
+            _invalidate_user_stats(current_user.id)
 
             if not integration:
                 raise HTTPException(
@@ -165,7 +211,7 @@ class IntegrationController:
                     detail="Integration not found"
                 )
 
-            return IntegrationResponse.model_validate(integration)
+            return orm_to_response(IntegrationResponse, integration)
         except ValueError as e:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -194,6 +240,7 @@ class IntegrationController:
             integration_id,
             current_user.id
         )
+        _invalidate_user_stats(current_user.id)
 
         if not deleted:
             raise HTTPException(
@@ -227,8 +274,6 @@ class IntegrationController:
         Raises:
             HTTPException: If not found
         """
-        from datetime import datetime
-
         expires = None
         if expires_at:
             try:
@@ -243,6 +288,7 @@ class IntegrationController:
             refresh_token,
             expires
         )
+        _invalidate_user_stats(current_user.id)
 
         if not integration:
             raise HTTPException(
@@ -250,7 +296,7 @@ class IntegrationController:
                 detail="Integration not found"
             )
 
-        return IntegrationResponse.model_validate(integration)
+        return orm_to_response(IntegrationResponse, integration)
 
     def disconnect_integration(
         self,
@@ -270,12 +316,13 @@ class IntegrationController:
         Raises:
             HTTPException: If not found
         """
-        integration = self.service.disconnect_integration(
+        disconnected = self.service.disconnect_integration(
             integration_id,
             current_user.id
         )
+        _invalidate_user_stats(current_user.id)
 
-        if not integration:
+        if not disconnected:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Integration not found"
@@ -306,6 +353,7 @@ class IntegrationController:
                 integration_id,
                 current_user.id
             )
+            _invalidate_user_stats(current_user.id)
             return result
         except ValueError as e:
             raise HTTPException(
@@ -344,6 +392,7 @@ class IntegrationController:
                 current_user.id,
                 force
             )
+            _invalidate_user_stats(current_user.id)
             return result
         except ValueError as e:
             raise HTTPException(
@@ -364,7 +413,7 @@ class IntegrationController:
         offset: int = 0,
         action: Optional[str] = None,
         status: Optional[str] = None
-    ) -> List[IntegrationLogResponse]:
+    ) -> ORJSONResponse:
         """
         Get logs for an integration.
 
@@ -377,7 +426,7 @@ class IntegrationController:
             status: Optional status filter
 
         Returns:
-            List of log responses
+            JSON response with the list of logs
         """
         logs = self.service.get_integration_logs(
             integration_id,
@@ -387,7 +436,10 @@ class IntegrationController:
             action,
             status
         )
-        return [IntegrationLogResponse.model_validate(log) for log in logs]
+        # trusted DB source, serialized straight to JSON
+        return ORJSONResponse(
+            content=orm_list_to_dicts(IntegrationLogResponse, logs)
+        )
 
     def get_sync_statistics(
         self,
@@ -404,13 +456,22 @@ class IntegrationController:
             days: Number of days to analyze
 
         Returns:
-            Statistics dictionary
+            Statistics dictionary (cached for up to a minute)
         """
-        return self.service.get_sync_statistics(
+        key = ("sync", current_user.id, integration_id, days)
+        with _STATS_CACHE_LOCK:
+            cached = _STATS_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        stats = self.service.get_sync_statistics(
             integration_id,
             current_user.id,
             days
         )
+        with _STATS_CACHE_LOCK:
+            _STATS_CACHE[key] = stats
+        return stats
 
     def get_statistics(
         self,
@@ -423,18 +484,27 @@ class IntegrationController:
             current_user: Authenticated user
 
         Returns:
-            Statistics dictionary
+            Statistics dictionary (cached for up to a minute)
         """
-        return self.service.get_statistics(current_user.id)
+        key = ("stats", current_user.id)
+        with _STATS_CACHE_LOCK:
+            cached = _STATS_CACHE.get(key)
+        if cached is not None:
+            return cached
+
+        stats = self.service.get_statistics(current_user.id)
+        with _STATS_CACHE_LOCK:
+            _STATS_CACHE[key] = stats
+        return stats
 
-    def get_supported_providers(self) -> Dict[str, Dict[str, Any]]:
+    def get_supported_providers(self) -> Response:
         """
         Get list of supported integration providers.
 
         Returns:
-            Provider configurations
+            Pre-serialized JSON response with provider configurations
         """
-        return self.service.get_supported_providers()
+        return Response(content=_SUPPORTED_PROVIDERS_JSON, media_type="application/json")
 
     async def get_oauth_url(
         self,
@@ -500,6 +570,7 @@ class IntegrationController:
                 current_user.id,
                 state
             )
+            _invalidate_user_stats(current_user.id)
             return {
                 "message": "Integration connected successfully",
                 "integration_id": str(integration.id),
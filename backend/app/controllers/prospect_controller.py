@@ -5,7 +5,8 @@ Handles authentication, authorization, and HTTP-specific logic.
 
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from fastapi import HTTPException, status
+from fastapi import HTTPException, status, Response
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from app.services.prospect_service import ProspectService
@@ -14,8 +15,15 @@ from app.schemas.prospect import (
     ProspectFilter, ProspectConversionRequest,
     BulkProspectCreate
 )
+from app.schemas.orm import orm_to_dict, orm_list_to_dicts, orm_to_response
 from app.models.user import UserProfile
-from app.models.prospect import ProspectStatus, ProspectSource
+from app.models.prospect import Prospect, ProspectStatus, ProspectSource
+from app.core.query_filters import parse_csv_enum
+from app.core.http_cache import weak_etag, etag_matches, not_modified
+
+# Lookup tables for comma-separated enum query filters
+_PROSPECT_STATUS_MAP = {s.value: s for s in ProspectStatus}
+_PROSPECT_SOURCE_MAP = {s.value: s for s in ProspectSource}
 
 
 class ProspectController:
@@ -25,51 +33,78 @@ class ProspectController:
         self.db = db
         self.service = ProspectService(db)
 
-    async def get_prospects(
+    def _raise_not_assigned(self, prospect_id: UUID, action: str) -> None:
+        """
+        Raise the right error after an assignee-scoped lookup found nothing.
+
+        Only runs on the failure path, to tell a missing prospect (404) apart
+        from one assigned to someone else (403).
+        """
+        if not self.service.prospect_exists(prospect_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Prospect not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Not authorized to {action} this prospect"
+        )
+
+    def _get_assigned_prospect(
+        self,
+        prospect_id: UUID,
+        current_user: UserProfile,
+        action: str
+    ) -> Prospect:
+        """
+        Load a prospect assigned to the current user in a single query.
+
+        Args:
+            prospect_id: Prospect UUID
+            current_user: Authenticated user
+            action: Verb used in the 403 message (access, update, convert)
+
+        Returns:
+            The prospect
+
+        Raises:
+            HTTPException: If prospect not found or access denied
+        """
+        prospect = self.service.get_prospect_for_user(prospect_id, current_user.id)
+        if not prospect:
+            self._raise_not_assigned(prospect_id, action)
+        return prospect
+
+    def get_prospects(
         self,
         current_user: UserProfile,
-        status: Optional[str] = None,
-        source: Optional[str] = None,
+        status_filter: Optional[str] = None,
+        source_filter: Optional[str] = None,
         campaign_id: Optional[UUID] = None,
         search: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> Dict[str, Any]:
+        limit: int = 100,
+        count: bool = False
+    ) -> ORJSONResponse:
         """
         Get prospects with filters.
 
         Args:
             current_user: Authenticated user
-            status: Status filter (comma-separated)
-            source: Source filter (comma-separated)
+            status_filter: Status filter (comma-separated)
+            source_filter: Source filter (comma-separated)
             campaign_id: Campaign ID filter
             search: Search term
             skip: Pagination offset
             limit: Pagination limit
+            count: Include the total match count (costs an extra COUNT query)
 
         Returns:
-            Dictionary with prospects and total count
+            JSON response with prospects and either the total count or has_more
         """
         # Parse filters
-        status_list = None
-        if status:
-            try:
-                status_list = [ProspectStatus(s.strip()) for s in status.split(',') if s.strip()]
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid status value"
-                )
-
-        source_list = None
-        if source:
-            try:
-                source_list = [ProspectSource(s.strip()) for s in source.split(',') if s.strip()]
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid source value"
-                )
+        status_list = parse_csv_enum(status_filter, _PROSPECT_STATUS_MAP, "status") if status_filter else None
+        source_list = parse_csv_enum(source_filter, _PROSPECT_SOURCE_MAP, "source") if source_filter else None
 
         # Create filter object
         # For MVP, filter by assigned_to = current_user
@@ -81,55 +116,53 @@ class ProspectController:
             assigned_to=current_user.id  # Only show user's assigned prospects
         )
 
-        prospects, total = self.service.get_prospects(
-            filters=prospect_filter,
-            skip=skip,
-            limit=limit
-        )
-
-        # Convert to response models
-        prospect_responses = [
-            ProspectResponse.from_orm(p) for p in prospects
-        ]
+        if count:
+            prospects, total = self.service.get_prospects(
+                filters=prospect_filter,
+                skip=skip,
+                limit=limit
+            )
+            page_info = {"total": total}
+        else:
+            prospects, has_more = self.service.get_prospects_page(
+                filters=prospect_filter,
+                skip=skip,
+                limit=limit
+            )
+            page_info = {"has_more": has_more}
 
-        return {
-            "prospects": prospect_responses,
-            "total": total,
+        # Trusted DB source: serialize straight to JSON, skipping revalidation
+        # and FastAPI's jsonable_encoder pass
+        return ORJSONResponse(content={
+            "prospects": orm_list_to_dicts(ProspectResponse, prospects),
+            **page_info,
             "skip": skip,
             "limit": limit
-        }
+        })
 
-    async def get_campaign_prospects(
+    def get_campaign_prospects(
         self,
         campaign_id: UUID,
         current_user: UserProfile,
-        status: Optional[str] = None,
+        status_filter: Optional[str] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> Dict[str, Any]:
+    ) -> ORJSONResponse:
         """
         Get prospects for a specific campaign.
 
         Args:
             campaign_id: Campaign UUID
             current_user: Authenticated user
-            status: Status filter (comma-separated)
+            status_filter: Status filter (comma-separated)
             skip: Pagination offset
             limit: Pagination limit
 
         Returns:
-            Dictionary with prospects and total count
+            JSON response with prospects and total count
         """
         # Parse status filter
-        status_list = None
-        if status:
-            try:
-                status_list = [ProspectStatus(s.strip()) for s in status.split(',') if s.strip()]
-            except ValueError:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Invalid status value"
-                )
+        status_list = parse_csv_enum(status_filter, _PROSPECT_STATUS_MAP, "status") if status_filter else None
 
         prospects = self.service.get_campaign_prospects(
             campaign_id=campaign_id,
@@ -138,18 +171,15 @@ class ProspectController:
             limit=limit
         )
 
-        # Convert to response models
-        prospect_responses = [
-            ProspectResponse.from_orm(p) for p in prospects
-        ]
-
-        return {
+        # Trusted DB source: serialize straight to JSON, skipping revalidation
+        # and FastAPI's jsonable_encoder pass
+        return ORJSONResponse(content={
             "campaign_id": campaign_id,
-            "prospects": prospect_responses,
-            "total": len(prospect_responses)
-        }
+            "prospects": orm_list_to_dicts(ProspectResponse, prospects),
+            "total": len(prospects)
+        })
 
-    async def get_recent_prospects(
+    def get_recent_prospects(
         self,
         current_user: UserProfile,
         days: int = 7,
@@ -168,44 +198,46 @@ class ProspectController:
         """
         prospects = self.service.get_recent_prospects(days=days, limit=limit)
 
-        return [ProspectResponse.from_orm(p) for p in prospects]
+        return [orm_to_response(ProspectResponse, p) for p in prospects]
 
-    async def get_prospect(
+    def get_prospect(
         self,
         prospect_id: UUID,
-        current_user: UserProfile
-    ) -> ProspectResponse:
+        current_user: UserProfile,
+        if_none_match: Optional[str] = None
+    ) -> Response:
         """
         Get a single prospect by ID.
 
+        When the client sends If-None-Match, only updated_at is fetched first
+        and an unchanged prospect is answered with 304 Not Modified.
+
         Args:
             prospect_id: Prospect UUID
             current_user: Authenticated user
+            if_none_match: Optional If-None-Match header value
 
         Returns:
-            Prospect details
+            JSON response with an ETag header, or an empty 304 response
 
         Raises:
             HTTPException: If prospect not found or access denied
         """
-        prospect = self.service.get_prospect(prospect_id)
-
-        if not prospect:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Prospect not found"
-            )
-
-        # Check if user has access (assigned to them)
-        if prospect.assigned_to != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to access this prospect"
-            )
-
-        return ProspectResponse.from_orm(prospect)
+        if if_none_match:
+            version = self.service.get_prospect_version_for_user(prospect_id, current_user.id)
+            if version is not None:
+                etag = weak_etag(prospect_id, version.updated_at)
+                if etag_matches(if_none_match, etag):
+                    return not_modified(etag)
+
+        prospect = self._get_assigned_prospect(prospect_id, current_user, "access")
+
+        return ORJSONResponse(
+            content=orm_to_dict(ProspectResponse, prospect),
+            headers={"ETag": weak_etag(prospect.id, prospect.updated_at)}
+        )
 
-    async def create_prospect(
+    def create_prospect(
         self,
         prospect_data: ProspectCreate,
         current_user: UserProfile
@@ -225,9 +257,9 @@ class ProspectController:
             created_by=current_user.id
         )
 
-        return ProspectResponse.from_orm(prospect)
+        return orm_to_response(ProspectResponse, prospect)
 
-    async def update_prospect(
+    def update_prospect(
         self,
         prospect_id: UUID,
         prospect_data: ProspectUpdate,
@@ -247,25 +279,13 @@ class ProspectController:
         Raises:
             HTTPException: If prospect not found or access denied
         """
-        prospect = self.service.get_prospect(prospect_id)
-
-        if not prospect:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Prospect not found"
-            )
-
-        # Check if user has access
-        if prospect.assigned_to != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to update this prospect"
-            )
+        prospect = self._get_assigned_prospect(prospect_id, current_user, "update")
 
         updated_prospect = self.service.update_prospect(
             prospect_id=prospect_id,
             prospect_data=prospect_data,
-            updated_by=current_user.id
+            updated_by=current_user.id,
+            prospect=prospect
         )
 
         if not updated_prospect:
@@ -274,9 +294,9 @@ class ProspectController:
                 detail="Prospect not found"
             )
 
-        return ProspectResponse.from_orm(updated_prospect)
+        return orm_to_response(ProspectResponse, updated_prospect)
 
-    async def delete_prospect(
+    def delete_prospect(
         self,
         prospect_id: UUID,
         current_user: UserProfile
@@ -294,32 +314,13 @@ class ProspectController:
         Raises:
             HTTPException: If prospect not found or access denied
         """
-        prospect = self.service.get_prospect(prospect_id)
-
-        if not prospect:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Prospect not found"
-            )
-
-        # Check if user has access
-        if prospect.assigned_to != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to delete this prospect"
-            )
-
-        success = self.service.delete_prospect(prospect_id)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Prospect not found"
-            )
+        # Ownership is part of the DELETE's WHERE clause
+        if not self.service.delete_prospect_for_user(prospect_id, current_user.id):
+            self._raise_not_assigned(prospect_id, "delete")
 
         return {"message": "Prospect deleted successfully"}
 
-    async def convert_to_contact(
+    def convert_to_contact(
         self,
         prospect_id: UUID,
         conversion_request: ProspectConversionRequest,
@@ -339,28 +340,16 @@ class ProspectController:
         Raises:
             HTTPException: If prospect not found or access denied
         """
-        prospect = self.service.get_prospect(prospect_id)
-
-        if not prospect:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Prospect not found"
-            )
-
-        # Check if user has access
-        if prospect.assigned_to != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Not authorized to convert this prospect"
-            )
+        prospect = self._get_assigned_prospect(prospect_id, current_user, "convert")
 
         return self.service.convert_to_contact(
             prospect_id=prospect_id,
             conversion_request=conversion_request,
-            converted_by=current_user.id
+            converted_by=current_user.id,
+            prospect=prospect
         )
 
-    async def get_prospect_statistics(
+    def get_prospect_statistics(
         self,
         current_user: UserProfile,
         campaign_id: Optional[UUID] = None
@@ -377,7 +366,7 @@ class ProspectController:
         """
         return self.service.get_prospect_statistics(campaign_id=campaign_id)
 
-    async def bulk_create_prospects(
+    def bulk_create_prospects(
         self,
         bulk_data: BulkProspectCreate,
         current_user: UserProfile
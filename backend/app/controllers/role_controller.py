@@ -1,6 +1,7 @@
 """
 Role Controller - HTTP request/response handling for Roles and Permissions.
-Handles validation, permissions, and response formatting for RBAC.
+Handles validation and response formatting for RBAC.
+Admin access is enforced by the roles router, not per method.
 """
 
 from typing import List, Dict, Any
@@ -14,6 +15,7 @@ from ..schemas.role import (
     PermissionResponse, RolePermissionUpdate
 )
 from ..models.user import UserProfile
+from ..schemas.orm import validate_orm_list
 
 
 class RoleController:
@@ -33,19 +35,9 @@ class RoleController:
 
         Returns:
             List of role responses
-
-        Raises:
-            HTTPException: If user lacks permission
         """
-        # Only admin can view roles
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view roles"
-            )
-
         roles = self.service.get_all_roles()
-        return [RoleResponse.model_validate(role) for role in roles]
+        return validate_orm_list(RoleResponse, roles)
 
     def get_role(self, role_id: UUID, current_user: UserProfile) -> RoleResponse:
         """
@@ -59,15 +51,8 @@ class RoleController:
             Role response
 
         Raises:
-            HTTPException: If role not found or user lacks permission
+            HTTPException: If role not found
         """
-        # Only admin can view roles
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view roles"
-            )
-
         role = self.service.get_role_by_id(role_id)
 
         if not role:
@@ -94,15 +79,8 @@ class RoleController:
             Role response
 
         Raises:
-            HTTPException: If role not found or user lacks permission
+            HTTPException: If role not found
         """
-        # Only admin can view roles
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view roles"
-            )
-
         role = self.service.get_role_by_name(role_name)
 
         if not role:
@@ -129,15 +107,8 @@ class RoleController:
             Created role response
 
         Raises:
-            HTTPException: If validation fails or user lacks permission
+            HTTPException: If validation fails
         """
-        # Only admin can create roles
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can create roles"
-            )
-
         try:
             role = self.service.create_role(role_data)
             return RoleResponse.model_validate(role)
@@ -165,15 +136,8 @@ class RoleController:
             Updated role response
 
         Raises:
-            HTTPException: If role not found or user lacks permission
+            HTTPException: If role not found
         """
-        # Only admin can update roles
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can update roles"
-            )
-
         updated_role = self.service.update_role(role_id, role_data)
 
         if not updated_role:
@@ -200,15 +164,8 @@ class RoleController:
             Success message
 
         Raises:
-            HTTPException: If role not found, system role, or user lacks permission
+            HTTPException: If role not found or system role
         """
-        # Only admin can delete roles
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can delete roles"
-            )
-
         try:
             success = self.service.delete_role(role_id)
 
@@ -239,17 +196,7 @@ class RoleController:
 
         Returns:
             Dictionary of permission_name -> True
-
-        Raises:
-            HTTPException: If user lacks permission
         """
-        # Only admin can view permissions
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view role permissions"
-            )
-
         permissions = self.service.get_role_permissions_dict(role_name)
         return permissions
 
@@ -271,31 +218,22 @@ class RoleController:
             Updated permissions with message
 
         Raises:
-            HTTPException: If role not found or user lacks permission
+            HTTPException: If role not found
         """
-        # Only admin can update permissions
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can update role permissions"
-            )
-
-        updated_role = self.service.update_role_permissions_by_name(
+        result = self.service.update_role_permissions_by_name(
             role_name,
             permission_update.permissions
         )
 
-        if not updated_role:
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Role '{role_name}' not found"
             )
 
         # Return updated permissions
-        updated_permissions = {
-            permission.name: True
-            for permission in updated_role.permissions
-        }
+        updated_role, permission_names = result
+        updated_permissions = dict.fromkeys(permission_names, True)
 
         return {
             "role_name": updated_role.display_name,
@@ -319,28 +257,19 @@ class RoleController:
             Restored permissions with message
 
         Raises:
-            HTTPException: If role not found or user lacks permission
+            HTTPException: If role not found
         """
-        # Only admin can restore permissions
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can restore default permissions"
-            )
-
-        restored_role = self.service.restore_default_permissions(role_name)
+        result = self.service.restore_default_permissions(role_name)
 
-        if not restored_role:
+        if not result:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Role '{role_name}' not found"
             )
 
         # Return restored permissions
-        restored_permissions = {
-            permission.name: True
-            for permission in restored_role.permissions
-        }
+        restored_role, permission_names = result
+        restored_permissions = dict.fromkeys(permission_names, True)
 
         return {
             "role_name": restored_role.display_name,
@@ -357,17 +286,7 @@ class RoleController:
 
         Returns:
             Role statistics
-
-        Raises:
-            HTTPException: If user lacks permission
         """
-        # Only admin can view statistics
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view role statistics"
-            )
-
         return self.service.get_role_statistics()
 
 
@@ -390,19 +309,9 @@ class PermissionController:
 
         Returns:
             List of permission responses
-
-        Raises:
-            HTTPException: If user lacks permission
         """
-        # Only admin can view permissions
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view permissions"
-            )
-
         permissions = self.service.get_all_permissions()
-        return [PermissionResponse.model_validate(p) for p in permissions]
+        return validate_orm_list(PermissionResponse, permissions)
 
     def get_permissions_grouped(
         self,
@@ -416,25 +325,13 @@ class PermissionController:
 
         Returns:
             Dictionary of category -> permissions
-
-        Raises:
-            HTTPException: If user lacks permission
         """
-        # Only admin can view permissions
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view permissions"
-            )
-
         grouped = self.service.get_permissions_grouped()
 
         # Convert to response models
         result = {}
         for category, permissions in grouped.items():
-            result[category] = [
-                PermissionResponse.model_validate(p) for p in permissions
-            ]
+            result[category] = validate_orm_list(PermissionResponse, permissions)
 
         return result
 
@@ -450,15 +347,5 @@ class PermissionController:
 
         Returns:
             Permission statistics
-
-        Raises:
-            HTTPException: If user lacks permission
         """
-        # Only admin can view statistics
-        if current_user.role != 'admin':
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Only administrators can view permission statistics"
-            )
-
         return self.service.get_permission_statistics()
@@ -10,6 +10,7 @@ from sqlalchemy.orm import Session
 
 from ..services.task_service import TaskService
 from ..schemas.task import TaskResponse, TaskCreate, TaskUpdate, TaskStatistics
+from ..schemas.orm import validate_orm_list, orm_to_response
 from ..models.user import UserProfile
 
 
@@ -20,6 +21,23 @@ class TaskController:
         self.db = db
         self.service = TaskService(db)
 
+    def _raise_not_assigned(self, task_id: UUID, action: str) -> None:
+        """
+        Raise the right error after an assignee-scoped write matched nothing.
+
+        Only runs on the failure path, to tell a missing task (404) apart
+        from one assigned to someone else (403).
+        """
+        if not self.service.task_exists(task_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Task not found"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"You don't have permission to {action} this task"
+        )
+
     def list_tasks(
         self,
         current_user: UserProfile,
@@ -43,7 +61,7 @@ class TaskController:
             priority=priority
         )
 
-        return [TaskResponse.model_validate(task) for task in tasks]
+        return validate_orm_list(TaskResponse, tasks)
 
     def get_task(
         self,
@@ -100,7 +118,7 @@ class TaskController:
             current_user=current_user
         )
 
-        return TaskResponse.model_validate(task)
+        return orm_to_response(TaskResponse, task)
 
     def update_task(
         self,
@@ -122,31 +140,13 @@ class TaskController:
         Raises:
             HTTPException: If task not found or user lacks permission
         """
-        # Get task to check permissions
-        task = self.service.get_task_by_id(task_id)
-
-        if not task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found"
-            )
-
-        # Check permission: user must be assigned to the task
-        if task.assigned_to != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to update this task"
-            )
-
-        updated_task = self.service.update_task(task_id, task_data)
+        # Ownership is part of the UPDATE's WHERE clause
+        updated_task = self.service.update_task_for_user(task_id, current_user.id, task_data)
 
         if not updated_task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found"
-            )
+            self._raise_not_assigned(task_id, "update")
 
-        return TaskResponse.model_validate(updated_task)
+        return orm_to_response(TaskResponse, updated_task)
 
     def delete_task(
         self,
@@ -166,29 +166,9 @@ class TaskController:
         Raises:
             HTTPException: If task not found or user lacks permission
         """
-        # Get task to check permissions
-        task = self.service.get_task_by_id(task_id)
-
-        if not task:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found"
-            )
-
-        # Check permission: user must be assigned to the task
-        if task.assigned_to != current_user.id:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="You don't have permission to delete this task"
-            )
-
-        success = self.service.delete_task(task_id)
-
-        if not success:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Task not found"
-            )
+        # Ownership is part of the DELETE's WHERE clause
+        if not self.service.delete_task_for_user(task_id, current_user.id):
+            self._raise_not_assigned(task_id, "delete")
 
         return {"message": "Task deleted successfully"}
 
@@ -218,7 +198,7 @@ class TaskController:
         """
         tasks = self.service.get_overdue_tasks(current_user.id)
 
-        return [TaskResponse.model_validate(task) for task in tasks]
+        return validate_orm_list(TaskResponse, tasks)
 
     def get_upcoming_tasks(
         self,
@@ -237,7 +217,7 @@ class TaskController:
         """
         tasks = self.service.get_upcoming_tasks(current_user.id, days)
 
-        return [TaskResponse.model_validate(task) for task in tasks]
+        return validate_orm_list(TaskResponse, tasks)
 
     def get_contact_tasks(
         self,
@@ -254,12 +234,7 @@ class TaskController:
         Returns:
             List of tasks
         """
-        tasks = self.service.get_tasks_by_contact(contact_id)
-
-        # Filter to only tasks the user has access to
-        accessible_tasks = [
-            task for task in tasks
-            if task.assigned_to == current_user.id or task.created_by == current_user.id
-        ]
+        # Only tasks the user is assigned to or created
+        tasks = self.service.get_tasks_by_contact_for_user(contact_id, current_user.id)
 
-        return [TaskResponse.model_validate(task) for task in accessible_tasks]
+        return validate_orm_list(TaskResponse, tasks)
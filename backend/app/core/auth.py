@@ -1,86 +1,157 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from typing import List, Callable, Union
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from threading import Lock
+from cachetools import TTLCache
+import hashlib
+import time
+from typing import List, Callable, Union, FrozenSet, Dict, Set, Tuple
+from uuid import UUID
 from .database import get_db
 from .security import verify_token
 from ..models.user import UserProfile
-from ..models.role import Role, Permission
+from ..models.role import Role, Permission, role_permissions
 
 security = HTTPBearer()
 
-def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+# Bearer token hash -> (detached UserProfile snapshot, token exp). Dashboards
+# poll with the same token many times a minute; a hit skips both the JWT decode
+# and the UserProfile SELECT. Entries are short-lived and dropped by
+# invalidate_cached_user() whenever the user row is changed through the API.
+_USER_CACHE: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_USER_CACHE_LOCK = Lock()
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _detached_user_snapshot(user: UserProfile) -> UserProfile:
+    """Copy a user's column values into a detached instance that can be shared across sessions"""
+    snapshot = UserProfile(**{
+        attr.key: getattr(user, attr.key)
+        for attr in inspect(UserProfile).column_attrs
+    })
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def invalidate_cached_user(user_id) -> None:
+    """Drop every cached token entry for a user after their row changes"""
+    user_id = str(user_id)
+    with _USER_CACHE_LOCK:
+        for key in [key for key, (user, _) in _USER_CACHE.items() if str(user.id) == user_id]:
+            _USER_CACHE.pop(key, None)
+
+
+def _credentials_exception() -> HTTPException:
+    # Built per failure: a shared instance would collect traceback frames
+    # (and the request locals they reference) every time it is re-raised
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+):
+    key = _token_key(credentials.credentials)
+    with _USER_CACHE_LOCK:
+        cached = _USER_CACHE.get(key)
+    if cached is not None:
+        snapshot, expires_at = cached
+        if expires_at is None or expires_at > time.time():
+            # Attach a per-session copy without re-selecting the row
+            return db.merge(snapshot, load=False)
+
     payload = verify_token(credentials.credentials)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     user_id = payload.get("sub")
     if user_id is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     user = db.query(UserProfile).filter(UserProfile.id == user_id).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    with _USER_CACHE_LOCK:
+        _USER_CACHE[key] = (_detached_user_snapshot(user), payload.get("exp"))
 
     return user
 
 # Role-based access control functions
 def require_role(allowed_roles: List[str]) -> Callable:
     """Decorator factory to require specific roles for endpoint access"""
+    allowed = frozenset(allowed_roles)
+    detail = f"Access denied. Required roles: {', '.join(allowed_roles)}"
+
     def role_checker(current_user: UserProfile = Depends(get_current_user)):
-        if current_user.role not in allowed_roles:
+        if current_user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Access denied. Required roles: {', '.join(allowed_roles)}"
+                detail=detail
             )
         return current_user
     return role_checker
 
+# Built once so every endpoint shares the same dependency callable, which lets
+# FastAPI's per-request dependency cache dedupe the check
+_REQUIRE_ADMIN = require_role(['admin'])
+_REQUIRE_MANAGER_OR_ADMIN = require_role(['admin', 'sales_manager'])
+_REQUIRE_SALES_USER = require_role(['admin', 'sales_manager', 'sales_rep'])
+_REQUIRE_ANY_AUTHENTICATED = require_role(['admin', 'sales_manager', 'sales_rep', 'user'])
+
 def require_admin():
     """Require admin role"""
-    return require_role(['admin'])
+    return _REQUIRE_ADMIN
 
 def require_manager_or_admin():
     """Require sales_manager or admin role"""
-    return require_role(['admin', 'sales_manager'])
+    return _REQUIRE_MANAGER_OR_ADMIN
 
 def require_sales_user():
     """Require any sales role (sales_rep, sales_manager, admin)"""
-    return require_role(['admin', 'sales_manager', 'sales_rep'])
+    return _REQUIRE_SALES_USER
 
 def require_any_authenticated():
     """Require any authenticated user"""
-    return require_role(['admin', 'sales_manager', 'sales_rep', 'user'])
+    return _REQUIRE_ANY_AUTHENTICATED
 
 # Data ownership validation
-def can_access_user_data(current_user: UserProfile, target_user_id: str) -> bool:
+def _is_same_user(user_id: UUID, other_id: Union[UUID, str, None]) -> bool:
+    """Compare ids as UUIDs, parsing the other side only when it isn't one already"""
+    if isinstance(other_id, UUID):
+        return user_id == other_id
+    try:
+        return user_id == UUID(str(other_id))
+    except ValueError:
+        return False
+
+def can_access_user_data(current_user: UserProfile, target_user_id: Union[UUID, str]) -> bool:
     """Check if current user can access another user's data"""
     if current_user.role == 'admin':
         return True
     if current_user.role == 'sales_manager':
         # TODO: Implement team membership check
         return True  # For now, allow managers to access all data
-    return str(current_user.id) == target_user_id
+    return _is_same_user(current_user.id, target_user_id)
 
-def can_modify_user_data(current_user: UserProfile, target_user_id: str) -> bool:
+def can_modify_user_data(current_user: UserProfile, target_user_id: Union[UUID, str]) -> bool:
     """Check if current user can modify another user's data"""
     if current_user.role == 'admin':
         return True
     if current_user.role == 'sales_manager':
         # TODO: Implement team membership check
         return True  # For now, allow managers to modify team data
-    return str(current_user.id) == target_user_id
+    return _is_same_user(current_user.id, target_user_id)
 
-def validate_data_access(target_user_id: str):
+def validate_data_access(target_user_id: Union[UUID, str]):
     """Dependency to validate data access permissions"""
     def access_validator(current_user: UserProfile = Depends(get_current_user)):
         if not can_access_user_data(current_user, target_user_id):
@@ -93,39 +164,79 @@ def validate_data_access(target_user_id: str):
 
 
 # Dynamic permission-based access control
-def get_user_permissions(db: Session, user: UserProfile) -> List[str]:
-    """Get all permission names for a user based on their role"""
-    role = db.query(Role).filter(
-        Role.name == user.role,
-        Role.is_active == True
-    ).first()
 
-    if not role:
-        return []
+# Process-wide {role name: permission names} map, shared by every request.
+# Roles change rarely, so the whole map is loaded in one query and reused for
+# _ROLE_PERMISSIONS_TTL seconds. invalidate_role_permissions() drops it on role
+# edits, which takes effect immediately in this worker and within the TTL in
+# the other gunicorn workers.
+_ROLE_PERMISSIONS_TTL = 60.0
+_EMPTY_PERMISSIONS: FrozenSet[str] = frozenset()
+
+# (generation, loaded_at, map); swapped atomically so readers never lock
+_role_permissions: Tuple[int, float, Dict[str, FrozenSet[str]]] = (0, float("-inf"), {})
+
+
+def invalidate_role_permissions() -> None:
+    """Drop the cached role permissions so the next check reloads them"""
+    global _role_permissions
+    generation = _role_permissions[0]
+    _role_permissions = (generation + 1, float("-inf"), {})
+
+
+def _load_role_permissions(db: Session) -> Dict[str, FrozenSet[str]]:
+    """Load active permission names for every active role in a single query"""
+    global _role_permissions
+    generation = _role_permissions[0]
+    rows = db.query(Role.name, Permission.name)\
+        .join(role_permissions, role_permissions.c.role_id == Role.id)\
+        .join(Permission, Permission.id == role_permissions.c.permission_id)\
+        .filter(Role.is_active == True, Permission.is_active == True)\
+        .all()
+
+    grouped: Dict[str, Set[str]] = {}
+    for role_name, permission_name in rows:
+        grouped.setdefault(role_name, set()).add(permission_name)
+    loaded = {role_name: frozenset(names) for role_name, names in grouped.items()}
+
+    # Don't publish a map that was read before a concurrent invalidation
+    if _role_permissions[0] == generation:
+        _role_permissions = (generation, time.monotonic(), loaded)
+    return loaded
 
-    return [permission.name for permission in role.permissions if permission.is_active]
+
+def get_user_permission_set(db: Session, user: UserProfile) -> FrozenSet[str]:
+    """Get the user's active permission names from the process-wide role cache"""
+    _, loaded_at, permissions_by_role = _role_permissions
+    if time.monotonic() - loaded_at > _ROLE_PERMISSIONS_TTL:
+        permissions_by_role = _load_role_permissions(db)
+    return permissions_by_role.get(user.role, _EMPTY_PERMISSIONS)
+
+
+def get_user_permissions(db: Session, user: UserProfile) -> List[str]:
+    """Get all permission names for a user based on their role"""
+    return list(get_user_permission_set(db, user))
 
 
 def has_permission(db: Session, user: UserProfile, permission_name: str) -> bool:
     """Check if user has a specific permission"""
-    user_permissions = get_user_permissions(db, user)
-    return permission_name in user_permissions
+    return permission_name in get_user_permission_set(db, user)
 
 
 def has_any_permission(db: Session, user: UserProfile, permission_names: List[str]) -> bool:
     """Check if user has any of the specified permissions"""
-    user_permissions = get_user_permissions(db, user)
-    return any(perm in user_permissions for perm in permission_names)
+    return not get_user_permission_set(db, user).isdisjoint(permission_names)
 
 
 def has_all_permissions(db: Session, user: UserProfile, permission_names: List[str]) -> bool:
     """Check if user has all of the specified permissions"""
-    user_permissions = get_user_permissions(db, user)
-    return all(perm in user_permissions for perm in permission_names)
+    return get_user_permission_set(db, user).issuperset(permission_names)
 
 
 def require_permission(permission_name: str) -> Callable:
     """Dependency factory to require a specific permission for endpoint access"""
+    detail = f"Permission denied. Required permission: {permission_name}"
+
     def permission_checker(
         current_user: UserProfile = Depends(get_current_user),
         db: Session = Depends(get_db)
@@ -133,7 +244,7 @@ def require_permission(permission_name: str) -> Callable:
         if not has_permission(db, current_user, permission_name):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied. Required permission: {permission_name}"
+                detail=detail
             )
         return current_user
     return permission_checker
@@ -141,14 +252,17 @@ def require_permission(permission_name: str) -> Callable:
 
 def require_any_permission(permission_names: List[str]) -> Callable:
     """Dependency factory to require any one of the specified permissions"""
+    required = frozenset(permission_names)
+    detail = f"Permission denied. Required one of: {', '.join(permission_names)}"
+
     def permission_checker(
         current_user: UserProfile = Depends(get_current_user),
         db: Session = Depends(get_db)
     ):
-        if not has_any_permission(db, current_user, permission_names):
+        if required.isdisjoint(get_user_permission_set(db, current_user)):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied. Required one of: {', '.join(permission_names)}"
+                detail=detail
             )
         return current_user
     return permission_checker
@@ -156,14 +270,17 @@ def require_any_permission(permission_names: List[str]) -> Callable:
 
 def require_all_permissions(permission_names: List[str]) -> Callable:
     """Dependency factory to require all specified permissions"""
+    required = frozenset(permission_names)
+    detail = f"Permission denied. Required all of: {', '.join(permission_names)}"
+
     def permission_checker(
         current_user: UserProfile = Depends(get_current_user),
         db: Session = Depends(get_db)
     ):
-        if not has_all_permissions(db, current_user, permission_names):
+        if not required <= get_user_permission_set(db, current_user):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Permission denied. Required all of: {', '.join(permission_names)}"
+                detail=detail
             )
         return current_user
     return permission_checker
@@ -174,7 +291,7 @@ def check_resource_permission(
     user: UserProfile,
     view_all_permission: str,
     view_own_permission: str,
-    resource_owner_id: str
+    resource_owner_id: Union[UUID, str]
 ) -> bool:
     """
     Check if user can access a resource based on view_all or view_own permissions
@@ -189,12 +306,14 @@ def check_resource_permission(
     Returns:
         True if user can access the resource
     """
+    user_permissions = get_user_permission_set(db, user)
+
     # Check if user has view_all permission
-    if has_permission(db, user, view_all_permission):
+    if view_all_permission in user_permissions:
         return True
 
     # Check if user has view_own permission and owns the resource
-    if has_permission(db, user, view_own_permission) and str(user.id) == str(resource_owner_id):
+    if view_own_permission in user_permissions and _is_same_user(user.id, resource_owner_id):
         return True
 
     return False
\ No newline at end of file
@@ -16,6 +16,15 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 480  # 8 hours instead of 30 minutes
+    BCRYPT_ROUNDS: int = 12  # Cost factor for new password hashes
+    # Run create_all when the app is imported (local dev). Deploys create
+    # tables once in the Heroku release phase via init_db.py instead.
+    AUTO_CREATE_TABLES: bool = False
+    # Per-worker connection pool. Keep (size + overflow) * gunicorn workers
+    # under the Heroku Postgres plan's connection limit.
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
 
     # Frontend URL for OAuth redirects
     FRONTEND_URL: str = "http://localhost:3000"
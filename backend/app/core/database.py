@@ -3,7 +3,20 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+# Multi-row INSERTs are already batched by SQLAlchemy 2.0 ("insertmanyvalues");
+# values_plus_batch also pages executemany UPDATE/DELETE through psycopg2's
+# execute_batch instead of one round trip per parameter set
+engine = create_engine(
+    settings.DATABASE_URL,
+    executemany_mode="values_plus_batch",
+    executemany_batch_page_size=500,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    # Heroku Postgres and its proxies drop idle connections; check before use
+    # and retire old ones rather than failing the first query after a lull
+    pool_pre_ping=True,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -0,0 +1,29 @@
+"""
+Conditional GET helpers (weak ETags derived from a row's id and updated_at).
+"""
+
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Response, status
+
+
+def weak_etag(resource_id: UUID, updated_at: Optional[datetime]) -> str:
+    """Build a weak ETag that changes whenever the row's updated_at changes."""
+    version = int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+    return f'W/"{resource_id}-{version}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
@@ -0,0 +1,31 @@
+"""
+Helpers for parsing list-style query parameters.
+"""
+
+from typing import Any, Dict, List
+
+from fastapi import HTTPException, status
+
+
+def parse_csv_enum(raw: str, mapping: Dict[str, Any], field: str) -> List[Any]:
+    """
+    Parse a comma-separated query value into enum members, rejecting unknown values.
+
+    Args:
+        raw: Raw query value, e.g. "draft,active"
+        mapping: Precomputed {value: member} lookup for the enum
+        field: Parameter name used in the error message
+
+    Returns:
+        List of enum members
+
+    Raises:
+        HTTPException: 400 if any value is not in the mapping
+    """
+    try:
+        return [mapping[value] for value in map(str.strip, raw.split(',')) if value]
+    except KeyError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid {field} value"
+        )
@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta
 from typing import Optional
+from fastapi.concurrency import run_in_threadpool
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
 from .config import settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Hash checked when a user has no password (e.g. Microsoft SSO accounts), so
+# those logins take as long as a real bcrypt verify. Built on first use.
+_dummy_hash: Optional[bytes] = None
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
@@ -19,20 +22,55 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
-def verify_password(plain_password, hashed_password):
+def _password_bytes(password) -> bytes:
     # Bcrypt has a 72-byte maximum password length
     # Truncate if necessary to prevent errors
-    if isinstance(plain_password, str):
-        plain_password = plain_password.encode('utf-8')[:72].decode('utf-8', errors='ignore')
-    return pwd_context.verify(plain_password, hashed_password)
+    if isinstance(password, str):
+        encoded = password.encode('utf-8')
+        if len(encoded) <= 72:
+            # Common case: nothing to truncate, so skip the decode/re-encode
+            return encoded
+        # Drop any multi-byte character split by the cut
+        return encoded[:72].decode('utf-8', errors='ignore').encode('utf-8')
+    return password[:72]
+
+
+def verify_password(plain_password, hashed_password):
+    global _dummy_hash
+    if hashed_password is None:
+        if _dummy_hash is None:
+            _dummy_hash = bcrypt.hashpw(b"", bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS))
+        bcrypt.checkpw(_password_bytes(plain_password), _dummy_hash)
+        return False
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode('utf-8')
+    return bcrypt.checkpw(_password_bytes(plain_password), hashed_password)
 
 
 def get_password_hash(password):
-    # Bcrypt has a 72-byte maximum password length
-    # Truncate if necessary to prevent errors
-    if isinstance(password, str):
-        password = password.encode('utf-8')[:72].decode('utf-8', errors='ignore')
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(
+        _password_bytes(password),
+        bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    ).decode('utf-8')
+
+
+async def averify_password(plain_password, hashed_password):
+    """verify_password for async routes; bcrypt runs in the threadpool, off the event loop"""
+    return await run_in_threadpool(verify_password, plain_password, hashed_password)
+
+
+async def aget_password_hash(password):
+    """get_password_hash for async routes; bcrypt runs in the threadpool, off the event loop"""
+    return await run_in_threadpool(get_password_hash, password)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """True if a stored bcrypt hash was made with a cost other than BCRYPT_ROUNDS"""
+    try:
+        # Format: $2b$<cost>$<salt+digest>
+        return int(hashed_password.split('$')[2]) != settings.BCRYPT_ROUNDS
+    except (AttributeError, IndexError, ValueError):
+        return False
 
 
 def verify_token(token: str):
@@ -1,20 +1,38 @@
 from fastapi import FastAPI, Request, status, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from fastapi.staticfiles import StaticFiles
 from .core.database import engine, Base
+from .core.config import settings
+from .core.http_cache import etag_matches, not_modified
 from .routes import auth, contacts_new, tasks_new, dashboard, users_new, roles_new, system_config_new, custom_fields_new, email_templates_new, integrations_new, notes_new, activities_new, companies_new, deals_new, storage, campaigns, prospects, calendar_integration
 # Import all models to ensure SQLAlchemy relationships are set up properly
 from . import models
-import traceback
+import hashlib
+import logging
 import os
 from pathlib import Path
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
+logger = logging.getLogger(__name__)
 
-app = FastAPI(title="CRM API", version="1.0.0")
+# Create all tables (deploys do this once in the release phase via init_db.py)
+if settings.AUTO_CREATE_TABLES:
+    Base.metadata.create_all(bind=engine)
+
+app = FastAPI(title="CRM API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# CORS headers added to error responses, which bypass CORSMiddleware
+_ERROR_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Credentials": "true",
+    "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
+    "Access-Control-Allow-Headers": "*"
+}
+_VALIDATION_CORS_HEADERS = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Credentials": "true"
+}
 
 # CORS middleware - MUST be added BEFORE routes
 app.add_middleware(
@@ -69,21 +87,15 @@ app.include_router(
 async def global_exception_handler(request: Request, exc: Exception):
     """Handle all unhandled exceptions and ensure CORS headers are present"""
     error_detail = str(exc)
-    print(f"Unhandled exception: {error_detail}")
-    print(traceback.format_exc())
+    logger.exception("Unhandled exception: %s", error_detail)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "detail": error_detail,
             "type": "internal_server_error"
         },
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Credentials": "true",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-            "Access-Control-Allow-Headers": "*"
-        }
+        headers=_ERROR_CORS_HEADERS
     )
 
 
@@ -98,13 +110,10 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         except Exception:
             body = str(body)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={"detail": exc.errors(), "body": body},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Credentials": "true"
-        }
+        headers=_VALIDATION_CORS_HEADERS
     )
 
 
@@ -115,6 +124,15 @@ if frontend_dist_path.exists():
     # Mount static assets
     app.mount("/assets", StaticFiles(directory=str(frontend_dist_path / "assets")), name="assets")
     
+    # index.html only changes on redeploy: read it once and let browsers
+    # revalidate it with an ETag instead of re-reading the file per request
+    index_file = frontend_dist_path / "index.html"
+    index_html = index_file.read_bytes() if index_file.exists() else None
+    index_etag = (
+        f'"{hashlib.md5(index_html, usedforsecurity=False).hexdigest()}"'
+        if index_html is not None else None
+    )
+
     # Custom 404 handler to serve React app for non-API routes
     @app.exception_handler(404)
     async def custom_404_handler(request: Request, exc):
@@ -123,9 +141,13 @@ if frontend_dist_path.exists():
             return JSONResponse(status_code=404, content={"detail": "Not found"})
         
         # For non-API routes, serve the React app (SPA)
-        index_file = frontend_dist_path / "index.html"
-        if index_file.exists():
-            return FileResponse(str(index_file))
+        if index_html is not None:
+            if etag_matches(request.headers.get("if-none-match"), index_etag):
+                return not_modified(index_etag)
+            return Response(
+                content=index_html,
+                media_type="text/html",
+                headers={"ETag": index_etag, "Cache-Control": "no-cache"}
+            )
         
         return JSONResponse(status_code=404, content={"detail": "Page not found"})
-
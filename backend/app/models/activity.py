@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, DateTime, Text, Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import uuid
@@ -20,7 +20,7 @@ class Activity(Base):
     end_time = Column(DateTime(timezone=True), nullable=True)
     location = Column(String(500), nullable=True)
     meeting_link = Column(Text, nullable=True)
-    attendees = Column(Text, nullable=True)  # JSON array of email addresses
+    attendees = Column(JSONB, nullable=True)  # JSON array of email addresses
 
     # Outlook integration fields
     outlook_event_id = Column(String(255), unique=True, nullable=True, index=True)
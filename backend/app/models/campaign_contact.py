@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Numeric, Boolean, Text, Enum as SQLEnum, CheckConstraint
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Numeric, Boolean, Text, Enum as SQLEnum, CheckConstraint, Index, and_, case
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.sql import func
 import uuid
 import enum
@@ -86,6 +87,24 @@ class CampaignContact(Base):
             '(contact_id IS NOT NULL AND prospect_id IS NULL) OR (contact_id IS NULL AND prospect_id IS NOT NULL)',
             name='check_contact_or_prospect'
         ),
+        # Audience pages, status filters and duplicate-recipient checks are
+        # always scoped to one campaign
+        Index('ix_campaign_contacts_campaign_status', 'campaign_id', 'status'),
+        Index('ix_campaign_contacts_campaign_created', 'campaign_id', 'created_at'),
+        Index('ix_campaign_contacts_campaign_contact', 'campaign_id', 'contact_id'),
+        Index('ix_campaign_contacts_campaign_prospect', 'campaign_id', 'prospect_id'),
+        # Conversion listings only ever read converted rows, newest first
+        Index(
+            'ix_campaign_contacts_campaign_converted',
+            'campaign_id', 'converted_at',
+            postgresql_where=converted_at.isnot(None)
+        ),
+        # One row per recipient per campaign, whichever of the two ids is set
+        Index(
+            'ix_campaign_contacts_campaign_recipient',
+            'campaign_id', func.coalesce(contact_id, prospect_id),
+            unique=True
+        ),
     )
 
     # Relationships
@@ -99,37 +118,70 @@ class CampaignContact(Base):
         recipient_id = self.contact_id or self.prospect_id
         return f"<CampaignContact Campaign={self.campaign_id} {recipient_type}={recipient_id} Status={self.status}>"
 
-    @property
+    # Derived attributes are hybrids so queries can filter, sort and aggregate
+    # on them in SQL, e.g. order_by(CampaignContact.engagement_score.desc())
+
+    @hybrid_property
     def recipient_type(self):
         """Returns whether this is for a contact or prospect"""
         return "contact" if self.contact_id else "prospect"
 
-    @property
+    @recipient_type.inplace.expression
+    @classmethod
+    def _recipient_type_expression(cls):
+        return case((cls.contact_id.isnot(None), "contact"), else_="prospect")
+
+    @hybrid_property
     def recipient_id(self):
         """Returns the ID of the recipient (contact or prospect)"""
         return self.contact_id or self.prospect_id
 
-    @property
+    @recipient_id.inplace.expression
+    @classmethod
+    def _recipient_id_expression(cls):
+        return func.coalesce(cls.contact_id, cls.prospect_id)
+
+    @hybrid_property
     def was_opened(self):
         """Check if recipient opened the message"""
         return self.opened_at is not None
 
-    @property
+    @was_opened.inplace.expression
+    @classmethod
+    def _was_opened_expression(cls):
+        return cls.opened_at.isnot(None)
+
+    @hybrid_property
     def was_clicked(self):
         """Check if recipient clicked a link"""
         return self.clicked_at is not None
 
-    @property
+    @was_clicked.inplace.expression
+    @classmethod
+    def _was_clicked_expression(cls):
+        return cls.clicked_at.isnot(None)
+
+    @hybrid_property
     def was_converted(self):
         """Check if recipient converted to a deal"""
         return self.status == EngagementStatus.CONVERTED and self.deal_id is not None
 
-    @property
+    @was_converted.inplace.expression
+    @classmethod
+    def _was_converted_expression(cls):
+        return and_(cls.status == EngagementStatus.CONVERTED, cls.deal_id.isnot(None))
+
+    @hybrid_property
     def was_delivered(self):
         """Check if message was successfully delivered"""
         return self.delivered_at is not None
 
-    @property
+    @was_delivered.inplace.expression
+    @classmethod
+    def _was_delivered_expression(cls):
+        return cls.delivered_at.isnot(None)
+
+    @hybrid_property
     def engagement_score(self):
         """Calculate engagement score based on actions taken"""
         score = 0
@@ -144,3 +196,14 @@ class CampaignContact(Base):
         if self.was_converted:
             score += 10
         return score
+
+    @engagement_score.inplace.expression
+    @classmethod
+    def _engagement_score_expression(cls):
+        return (
+            case((cls.delivered_at.isnot(None), 1), else_=0)
+            + case((cls.opened_at.isnot(None), 2), else_=0)
+            + case((cls.clicked_at.isnot(None), 3), else_=0)
+            + case((cls.responded_at.isnot(None), 5), else_=0)
+            + case((and_(cls.status == EngagementStatus.CONVERTED, cls.deal_id.isnot(None)), 10), else_=0)
+        )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Numeric
+from sqlalchemy import Column, String, DateTime, Integer, ForeignKey, Numeric, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -54,6 +54,11 @@ class CampaignMetric(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
+    # Performance history reads one campaign's snapshots in recorded_at order
+    __table_args__ = (
+        Index('ix_campaign_metrics_campaign_recorded', 'campaign_id', 'recorded_at'),
+    )
+
     # Relationships
     campaign = relationship("Campaign", back_populates="metrics")
 
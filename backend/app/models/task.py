@@ -16,7 +16,7 @@ class Task(Base):
     due_date = Column(DateTime(timezone=True))
 
     # Foreign Keys
-    contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id"))
+    contact_id = Column(UUID(as_uuid=True), ForeignKey("contacts.id"), index=True)
     deal_id = Column(UUID(as_uuid=True), ForeignKey("deals.id"))
     assigned_to = Column(UUID(as_uuid=True), ForeignKey("user_profiles.id"))
     created_by = Column(UUID(as_uuid=True), ForeignKey("user_profiles.id"))
@@ -5,6 +5,7 @@ All specific repositories should inherit from this base class.
 
 from typing import Generic, TypeVar, Type, Optional, List, Any, Dict
 from uuid import UUID
+from sqlalchemy import exists
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -164,7 +165,7 @@ class BaseRepository(Generic[ModelType]):
         Returns:
             True if record exists, False otherwise
         """
-        return self.db.query(self.model).filter(self.model.id == id).first() is not None
+        return self.db.query(exists().where(self.model.id == id)).scalar()
 
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """
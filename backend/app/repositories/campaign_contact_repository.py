@@ -2,15 +2,19 @@
 CampaignContact repository for database operations.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, desc
+from sqlalchemy import and_, or_, func, desc, case, delete, literal, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.campaign_contact import CampaignContact, EngagementStatus
 from app.repositories.base_repository import BaseRepository
 
+# Recipients per duplicate lookup / INSERT / commit in bulk audience adds
+BULK_ADD_BATCH_SIZE = 1000
+
 
 class CampaignContactRepository(BaseRepository[CampaignContact]):
     """Repository for CampaignContact (junction table) database operations."""
@@ -18,6 +22,54 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
     def __init__(self, db: Session):
         super().__init__(CampaignContact, db)
 
+    def _add_recipient(
+        self,
+        campaign_id: UUID,
+        column_name: str,
+        recipient_id: UUID,
+        email_sent_to: Optional[str] = None
+    ) -> CampaignContact:
+        """
+        Insert a campaign recipient, or return the existing row for it.
+
+        The INSERT relies on the unique recipient index, so the common case
+        is one round trip and concurrent adds can't create duplicates.
+
+        Args:
+            campaign_id: Campaign UUID
+            column_name: "contact_id" or "prospect_id"
+            recipient_id: Contact or prospect UUID
+            email_sent_to: Email address to send to
+
+        Returns:
+            Created or existing CampaignContact record
+        """
+        values = {
+            "campaign_id": campaign_id,
+            "contact_id": None,
+            "prospect_id": None,
+            column_name: recipient_id,
+            "email_sent_to": email_sent_to,
+            "status": EngagementStatus.PENDING
+        }
+        cc = self.db.scalars(
+            pg_insert(CampaignContact)
+            .values(**values)
+            .on_conflict_do_nothing()
+            .returning(CampaignContact)
+        ).first()
+
+        if cc is None:
+            # Already in the campaign
+            cc = self.db.query(CampaignContact)\
+                .filter(CampaignContact.campaign_id == campaign_id)\
+                .filter(getattr(CampaignContact, column_name) == recipient_id)\
+                .first()
+
+        self.db.commit()
+
+        return cc
+
     def add_contact_to_campaign(
         self,
         campaign_id: UUID,
@@ -35,29 +87,7 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             Created CampaignContact record
         """
-        # Check if already exists
-        existing = self.db.query(CampaignContact)\
-            .filter(CampaignContact.campaign_id == campaign_id)\
-            .filter(CampaignContact.contact_id == contact_id)\
-            .first()
-
-        if existing:
-            return existing
-
-        # Create new record
-        cc = CampaignContact(
-            campaign_id=campaign_id,
-            contact_id=contact_id,
-            prospect_id=None,
-            email_sent_to=email_sent_to,
-            status=EngagementStatus.PENDING
-        )
-
-        self.db.add(cc)
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        return self._add_recipient(campaign_id, "contact_id", contact_id, email_sent_to)
 
     def add_prospect_to_campaign(
         self,
@@ -76,29 +106,7 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             Created CampaignContact record
         """
-        # Check if already exists
-        existing = self.db.query(CampaignContact)\
-            .filter(CampaignContact.campaign_id == campaign_id)\
-            .filter(CampaignContact.prospect_id == prospect_id)\
-            .first()
-
-        if existing:
-            return existing
-
-        # Create new record
-        cc = CampaignContact(
-            campaign_id=campaign_id,
-            contact_id=None,
-            prospect_id=prospect_id,
-            email_sent_to=email_sent_to,
-            status=EngagementStatus.PENDING
-        )
-
-        self.db.add(cc)
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        return self._add_recipient(campaign_id, "prospect_id", prospect_id, email_sent_to)
 
     def get_campaign_audience(
         self,
@@ -127,6 +135,52 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
 
         return query.order_by(desc(CampaignContact.created_at)).offset(skip).limit(limit).all()
 
+    def get_campaign_audience_page(
+        self,
+        campaign_id: UUID,
+        status: Optional[List[EngagementStatus]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[CampaignContact], int]:
+        """
+        Get one page of audience members along with the total matching count.
+
+        The total is computed with a COUNT(*) OVER() window on the page query,
+        so rows and total come back in a single round-trip.
+
+        Args:
+            campaign_id: Campaign UUID
+            status: Optional list of statuses to filter by
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (CampaignContact records, total count)
+        """
+        query = self.db.query(CampaignContact)\
+            .filter(CampaignContact.campaign_id == campaign_id)
+
+        if status:
+            query = query.filter(CampaignContact.status.in_(status))
+
+        rows = query.add_columns(func.count().over().label('total_count'))\
+            .order_by(desc(CampaignContact.created_at))\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+
+        if not rows:
+            # Past the last page the window yields nothing, so count explicitly
+            return [], (query.count() if skip else 0)
+
+        return [cc for cc, _ in rows], rows[0].total_count
+
+    def count_campaign_audience(self, campaign_id: UUID) -> int:
+        """Count all audience members of a campaign."""
+        return self.db.query(func.count(CampaignContact.id))\
+            .filter(CampaignContact.campaign_id == campaign_id)\
+            .scalar()
+
     def get_contact_campaigns(self, contact_id: UUID) -> List[CampaignContact]:
         """Get all campaigns a contact is part of."""
         return self.db.query(CampaignContact)\
@@ -141,6 +195,33 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
             .order_by(desc(CampaignContact.created_at))\
             .all()
 
+    def _apply_update(
+        self,
+        campaign_contact_id: UUID,
+        **values: Any
+    ) -> Optional[CampaignContact]:
+        """
+        Apply a state transition in a single UPDATE ... RETURNING.
+
+        Values may be SQL expressions over the current row (e.g. counter
+        increments), which keeps the change atomic without reading it first.
+
+        Args:
+            campaign_contact_id: CampaignContact UUID
+            **values: Column values to set
+
+        Returns:
+            Updated CampaignContact or None if not found
+        """
+        cc = self.db.scalars(
+            update(CampaignContact)
+            .where(CampaignContact.id == campaign_contact_id)
+            .values(**values)
+            .returning(CampaignContact)
+        ).first()
+        self.db.commit()
+        return cc
+
     def mark_as_sent(
         self,
         campaign_contact_id: UUID,
@@ -158,87 +239,76 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             Updated CampaignContact or None if not found
         """
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
-
-        cc.status = EngagementStatus.SENT
-        cc.sent_at = datetime.utcnow()
+        values = {
+            "status": EngagementStatus.SENT,
+            "sent_at": datetime.utcnow()
+        }
         if email_message_id:
-            cc.email_message_id = email_message_id
+            values["email_message_id"] = email_message_id
         if email_subject:
-            cc.email_subject = email_subject
+            values["email_subject"] = email_subject
 
-        self.db.commit()
-        self.db.refresh(cc)
+        return self._apply_update(campaign_contact_id, **values)
 
-        return cc
-
-    def mark_as_delivered(self, campaign_contact_id: UUID) -> Optional[CampaignContact]:
-        """Mark a campaign contact as delivered."""
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
+    def mark_many_as_sent(self, campaign_contact_ids: List[UUID]) -> int:
+        """
+        Mark several campaign contacts as sent in one UPDATE.
 
-        cc.status = EngagementStatus.DELIVERED
-        cc.delivered_at = datetime.utcnow()
+        Args:
+            campaign_contact_ids: CampaignContact UUIDs
 
+        Returns:
+            Number of rows updated
+        """
+        if not campaign_contact_ids:
+            return 0
+
+        result = self.db.execute(
+            update(CampaignContact)
+            .where(CampaignContact.id.in_(campaign_contact_ids))
+            .values(status=EngagementStatus.SENT, sent_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
         self.db.commit()
-        self.db.refresh(cc)
+        return result.rowcount
 
-        return cc
+    def mark_as_delivered(self, campaign_contact_id: UUID) -> Optional[CampaignContact]:
+        """Mark a campaign contact as delivered."""
+        return self._apply_update(
+            campaign_contact_id,
+            status=EngagementStatus.DELIVERED,
+            delivered_at=datetime.utcnow()
+        )
 
     def mark_as_opened(self, campaign_contact_id: UUID) -> Optional[CampaignContact]:
         """Mark a campaign contact as opened."""
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
-
-        now = datetime.utcnow()
-
-        if not cc.opened_at:
-            cc.opened_at = now
-            cc.status = EngagementStatus.OPENED
-
-        cc.open_count += 1
-
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        # Status and opened_at only change on the first open
+        first_open = CampaignContact.opened_at.is_(None)
+        return self._apply_update(
+            campaign_contact_id,
+            opened_at=func.coalesce(CampaignContact.opened_at, datetime.utcnow()),
+            status=case((first_open, literal(EngagementStatus.OPENED, CampaignContact.status.type)), else_=CampaignContact.status),
+            open_count=CampaignContact.open_count + 1
+        )
 
     def mark_as_clicked(self, campaign_contact_id: UUID) -> Optional[CampaignContact]:
         """Mark a campaign contact as clicked."""
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
-
-        now = datetime.utcnow()
-
-        if not cc.clicked_at:
-            cc.clicked_at = now
-            cc.status = EngagementStatus.CLICKED
-
-        cc.click_count += 1
-
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        # Status and clicked_at only change on the first click
+        first_click = CampaignContact.clicked_at.is_(None)
+        return self._apply_update(
+            campaign_contact_id,
+            clicked_at=func.coalesce(CampaignContact.clicked_at, datetime.utcnow()),
+            status=case((first_click, literal(EngagementStatus.CLICKED, CampaignContact.status.type)), else_=CampaignContact.status),
+            click_count=CampaignContact.click_count + 1
+        )
 
     def mark_as_responded(self, campaign_contact_id: UUID) -> Optional[CampaignContact]:
         """Mark a campaign contact as responded."""
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
-
-        cc.status = EngagementStatus.RESPONDED
-        cc.responded_at = datetime.utcnow()
-
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        return self._apply_update(
+            campaign_contact_id,
+            status=EngagementStatus.RESPONDED,
+            responded_at=datetime.utcnow()
+        )
 
     def mark_as_converted(
         self,
@@ -257,19 +327,13 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             Updated CampaignContact or None if not found
         """
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
-
-        cc.status = EngagementStatus.CONVERTED
-        cc.converted_at = datetime.utcnow()
-        cc.deal_id = deal_id
-        cc.conversion_value = conversion_value
-
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        return self._apply_update(
+            campaign_contact_id,
+            status=EngagementStatus.CONVERTED,
+            converted_at=datetime.utcnow(),
+            deal_id=deal_id,
+            conversion_value=conversion_value
+        )
 
     def mark_as_bounced(
         self,
@@ -288,82 +352,141 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             Updated CampaignContact or None if not found
         """
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
-
-        cc.status = EngagementStatus.BOUNCED
-        cc.bounced_at = datetime.utcnow()
-        cc.bounce_type = bounce_type
+        values = {
+            "status": EngagementStatus.BOUNCED,
+            "bounced_at": datetime.utcnow(),
+            "bounce_type": bounce_type
+        }
         if error_message:
-            cc.error_message = error_message
+            values["error_message"] = error_message
 
-        self.db.commit()
-        self.db.refresh(cc)
-
-        return cc
+        return self._apply_update(campaign_contact_id, **values)
 
     def mark_as_unsubscribed(self, campaign_contact_id: UUID) -> Optional[CampaignContact]:
         """Mark a campaign contact as unsubscribed."""
-        cc = self.get(campaign_contact_id)
-        if not cc:
-            return None
+        return self._apply_update(
+            campaign_contact_id,
+            status=EngagementStatus.UNSUBSCRIBED,
+            unsubscribed_at=datetime.utcnow()
+        )
 
-        cc.status = EngagementStatus.UNSUBSCRIBED
-        cc.unsubscribed_at = datetime.utcnow()
+    def _existing_recipient_ids(
+        self,
+        campaign_id: UUID,
+        column,
+        recipient_ids: List[UUID]
+    ) -> Set[UUID]:
+        """
+        Get which of the given recipients are already in a campaign.
 
+        Args:
+            campaign_id: Campaign UUID
+            column: CampaignContact.contact_id or CampaignContact.prospect_id
+            recipient_ids: Contact or prospect UUIDs to check
+
+        Returns:
+            Set of recipient UUIDs already in the campaign
+        """
+        if not recipient_ids:
+            return set()
+
+        rows = self.db.query(column)\
+            .filter(CampaignContact.campaign_id == campaign_id)\
+            .filter(column.in_(recipient_ids))\
+            .all()
+        return {row[0] for row in rows}
+
+    def _insert_recipients(self, rows: List[Dict[str, Any]]) -> int:
+        """
+        Insert campaign recipients in a single statement and commit.
+
+        Rows that hit the unique recipient index (added concurrently by
+        another request) are skipped rather than failing the batch.
+
+        Args:
+            rows: CampaignContact column values, one dict per recipient
+
+        Returns:
+            Number of rows actually inserted
+        """
+        if not rows:
+            return 0
+
+        stmt = pg_insert(CampaignContact)\
+            .values(rows)\
+            .on_conflict_do_nothing()\
+            .returning(CampaignContact.id)
+        inserted = len(self.db.execute(stmt).all())
         self.db.commit()
-        self.db.refresh(cc)
 
-        return cc
+        return inserted
 
-    def bulk_add_contacts(
+    def _bulk_add_recipients(
         self,
         campaign_id: UUID,
-        contact_ids: List[UUID]
+        column_name: str,
+        recipient_ids: List[UUID]
     ) -> Dict[str, Any]:
         """
-        Bulk add contacts to a campaign.
+        Add contacts or prospects to a campaign in bounded batches.
+
+        Each batch does one duplicate lookup and one INSERT and is committed
+        on its own, so large audiences don't build huge IN lists or hold a
+        single long transaction.
 
         Args:
             campaign_id: Campaign UUID
-            contact_ids: List of contact UUIDs
+            column_name: "contact_id" or "prospect_id"
+            recipient_ids: Contact or prospect UUIDs
 
         Returns:
             Dictionary with results (added_count, skipped_count)
         """
+        column = getattr(CampaignContact, column_name)
         added_count = 0
-        skipped_count = 0
 
-        for contact_id in contact_ids:
-            # Check if already exists
-            existing = self.db.query(CampaignContact)\
-                .filter(CampaignContact.campaign_id == campaign_id)\
-                .filter(CampaignContact.contact_id == contact_id)\
-                .first()
-
-            if existing:
-                skipped_count += 1
-                continue
-
-            # Create new record
-            cc = CampaignContact(
-                campaign_id=campaign_id,
-                contact_id=contact_id,
-                prospect_id=None,
-                status=EngagementStatus.PENDING
-            )
-            self.db.add(cc)
-            added_count += 1
-
-        self.db.commit()
+        for start in range(0, len(recipient_ids), BULK_ADD_BATCH_SIZE):
+            batch = recipient_ids[start:start + BULK_ADD_BATCH_SIZE]
+            existing_ids = self._existing_recipient_ids(campaign_id, column, batch)
+
+            rows = []
+            for recipient_id in batch:
+                if recipient_id in existing_ids:
+                    continue
+                existing_ids.add(recipient_id)
+                rows.append({
+                    "campaign_id": campaign_id,
+                    "contact_id": None,
+                    "prospect_id": None,
+                    column_name: recipient_id,
+                    "status": EngagementStatus.PENDING
+                })
+
+            added_count += self._insert_recipients(rows)
 
         return {
             "added_count": added_count,
-            "skipped_count": skipped_count,
-            "total_requested": len(contact_ids)
+            "skipped_count": len(recipient_ids) - added_count,
+            "total_requested": len(recipient_ids)
         }
 
+    def bulk_add_contacts(
+        self,
+        campaign_id: UUID,
+        contact_ids: List[UUID]
+    ) -> Dict[str, Any]:
+        """
+        Bulk add contacts to a campaign.
+
+        Args:
+            campaign_id: Campaign UUID
+            contact_ids: List of contact UUIDs
+
+        Returns:
+            Dictionary with results (added_count, skipped_count)
+        """
+        return self._bulk_add_recipients(campaign_id, "contact_id", contact_ids)
+
     def bulk_add_prospects(
         self,
         campaign_id: UUID,
@@ -379,37 +502,7 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             Dictionary with results (added_count, skipped_count)
         """
-        added_count = 0
-        skipped_count = 0
-
-        for prospect_id in prospect_ids:
-            # Check if already exists
-            existing = self.db.query(CampaignContact)\
-                .filter(CampaignContact.campaign_id == campaign_id)\
-                .filter(CampaignContact.prospect_id == prospect_id)\
-                .first()
-
-            if existing:
-                skipped_count += 1
-                continue
-
-            # Create new record
-            cc = CampaignContact(
-                campaign_id=campaign_id,
-                contact_id=None,
-                prospect_id=prospect_id,
-                status=EngagementStatus.PENDING
-            )
-            self.db.add(cc)
-            added_count += 1
-
-        self.db.commit()
-
-        return {
-            "added_count": added_count,
-            "skipped_count": skipped_count,
-            "total_requested": len(prospect_ids)
-        }
+        return self._bulk_add_recipients(campaign_id, "prospect_id", prospect_ids)
 
     def remove_from_campaign(
         self,
@@ -428,24 +521,21 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             True if removed, False if not found
         """
-        query = self.db.query(CampaignContact)\
-            .filter(CampaignContact.campaign_id == campaign_id)
-
         if contact_id:
-            query = query.filter(CampaignContact.contact_id == contact_id)
+            recipient_filter = CampaignContact.contact_id == contact_id
         elif prospect_id:
-            query = query.filter(CampaignContact.prospect_id == prospect_id)
+            recipient_filter = CampaignContact.prospect_id == prospect_id
         else:
             return False
 
-        cc = query.first()
-        if not cc:
-            return False
-
-        self.db.delete(cc)
+        removed_id = self.db.execute(
+            delete(CampaignContact)
+            .where(CampaignContact.campaign_id == campaign_id, recipient_filter)
+            .returning(CampaignContact.id)
+        ).scalar()
         self.db.commit()
 
-        return True
+        return removed_id is not None
 
     def reset_for_resend(self, campaign_contact_id: UUID) -> bool:
         """
@@ -457,34 +547,28 @@ class CampaignContactRepository(BaseRepository[CampaignContact]):
         Returns:
             True if reset, False if not found
         """
-        cc = self.db.query(CampaignContact)\
-            .filter(CampaignContact.id == campaign_contact_id)\
-            .first()
-
-        if not cc:
-            return False
-
-        # Reset status to pending
-        cc.status = EngagementStatus.PENDING
-
-        # Clear timestamps and counters
-        cc.sent_at = None
-        cc.delivered_at = None
-        cc.opened_at = None
-        cc.clicked_at = None
-        cc.responded_at = None
-        cc.bounced_at = None
-        cc.converted_at = None
-
-        cc.open_count = 0
-        cc.click_count = 0
-        # Note: engagement_score is likely a computed property, don't set it directly
-
-        # Clear error info
-        cc.error_message = None
-        cc.bounce_type = None
-
+        reset_id = self.db.execute(
+            update(CampaignContact)
+            .where(CampaignContact.id == campaign_contact_id)
+            .values(
+                # Reset status to pending
+                status=EngagementStatus.PENDING,
+                # Clear timestamps and counters
+                sent_at=None,
+                delivered_at=None,
+                opened_at=None,
+                clicked_at=None,
+                responded_at=None,
+                bounced_at=None,
+                converted_at=None,
+                open_count=0,
+                click_count=0,
+                # Clear error info
+                error_message=None,
+                bounce_type=None
+            )
+            .returning(CampaignContact.id)
+        ).scalar()
         self.db.commit()
-        self.db.refresh(cc)
 
-        return True
+        return reset_id is not None
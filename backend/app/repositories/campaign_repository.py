@@ -2,19 +2,35 @@
 Campaign repository for database operations.
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from uuid import UUID
 from datetime import datetime, timedelta
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func, desc
-from decimal import Decimal
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import or_, and_, func, desc, select, update
+from threading import Lock
+from cachetools import TTLCache
 
 from app.models.campaign import Campaign, CampaignStatus, CampaignType
 from app.models.campaign_contact import CampaignContact, EngagementStatus
 from app.models.prospect import Prospect
+from app.models.contact import Contact
+from app.models.company import Company
 from app.models.deal import Deal
 from app.repositories.base_repository import BaseRepository
 
+# owner_id (or None for all campaigns) -> get_statistics() result. Dashboards
+# request the same aggregates many times a minute; entries are short-lived and
+# dropped by invalidate_campaign_statistics() whenever this worker writes a
+# campaign, so other gunicorn workers lag by at most the TTL.
+_STATISTICS_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=15)
+_STATISTICS_CACHE_LOCK = Lock()
+
+
+def invalidate_campaign_statistics() -> None:
+    """Drop every cached campaign statistics entry after a campaign changes"""
+    with _STATISTICS_CACHE_LOCK:
+        _STATISTICS_CACHE.clear()
+
 
 class CampaignRepository(BaseRepository[Campaign]):
     """Repository for Campaign database operations."""
@@ -22,6 +38,31 @@ class CampaignRepository(BaseRepository[Campaign]):
     def __init__(self, db: Session):
         super().__init__(Campaign, db)
 
+    def create(self, *, obj_in: Dict[str, Any]) -> Campaign:
+        """Create a campaign and drop the cached statistics."""
+        campaign = super().create(obj_in=obj_in)
+        invalidate_campaign_statistics()
+        return campaign
+
+    def update(self, *, db_obj: Campaign, obj_in: Dict[str, Any]) -> Campaign:
+        """Update a campaign and drop the cached statistics."""
+        campaign = super().update(db_obj=db_obj, obj_in=obj_in)
+        invalidate_campaign_statistics()
+        return campaign
+
+    def delete(self, *, id: UUID) -> bool:
+        """Delete a campaign and drop the cached statistics."""
+        deleted = super().delete(id=id)
+        invalidate_campaign_statistics()
+        return deleted
+
+    def get_with_template(self, campaign_id: UUID) -> Optional[Campaign]:
+        """Get a campaign by ID with its email template loaded in the same query."""
+        return self.db.query(Campaign)\
+            .options(joinedload(Campaign.email_template))\
+            .filter(Campaign.id == campaign_id)\
+            .first()
+
     def get_by_owner(
         self,
         owner_id: UUID,
@@ -76,9 +117,92 @@ class CampaignRepository(BaseRepository[Campaign]):
         Returns:
             Tuple of (list of campaigns, total count)
         """
-        query = self.db.query(Campaign)
+        query = self._apply_search_filters(self.db.query(Campaign), search_term, filters)
+
+        # Apply pagination and ordering; the template is joined in so that
+        # rendering email_template_name does not issue one query per row.
+        # The total rides along as a window count over the filtered rows.
+        rows = query.options(joinedload(Campaign.email_template))\
+            .add_columns(func.count().over().label("total_count"))\
+            .order_by(desc(Campaign.created_at))\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+
+        campaigns = [row[0] for row in rows]
+        total = self._window_total(rows, query, skip)
+
+        return campaigns, total
+
+    def search_summaries(
+        self,
+        search_term: str,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Any], int]:
+        """
+        Search campaigns, returning only the columns needed for index listings.
 
-        # Search in name and description
+        Args:
+            search_term: Text to search for
+            filters: Additional filters (status, type, owner_id, etc.)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of summary rows, total count)
+        """
+        query = self._apply_search_filters(
+            self.db.query(
+                Campaign.id,
+                Campaign.name,
+                Campaign.status,
+                Campaign.type,
+                Campaign.owner_id,
+                Campaign.target_audience_size,
+                Campaign.created_at
+            ),
+            search_term,
+            filters
+        )
+
+        rows = query.add_columns(func.count().over().label("total_count"))\
+            .order_by(desc(Campaign.created_at))\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+
+        total = self._window_total(rows, query, skip)
+
+        return rows, total
+
+    def _window_total(self, rows: List[Any], query, skip: int) -> int:
+        """
+        Read the total from a page selected with count(*) OVER ().
+
+        Args:
+            rows: Page rows, each ending with a total_count column
+            query: The filtered query, used only when the page is empty
+            skip: Offset the page was requested at
+
+        Returns:
+            Total number of rows matching the filters
+        """
+        if rows:
+            return rows[0].total_count
+        # An empty page past the end carries no count; only then ask for it
+        return query.count() if skip else 0
+
+    def _apply_search_filters(
+        self,
+        query,
+        search_term: str,
+        filters: Optional[Dict[str, Any]] = None
+    ):
+        """Apply search term and filter criteria to a campaign query."""
+        # Search in name and description; the pg_trgm GIN indexes from
+        # migrations/add_campaign_search_trgm_indexes.py serve these ILIKEs
         if search_term:
             search_filter = or_(
                 Campaign.name.ilike(f"%{search_term}%"),
@@ -129,13 +253,7 @@ class CampaignRepository(BaseRepository[Campaign]):
             if 'max_budget' in filters and filters['max_budget'] is not None:
                 query = query.filter(Campaign.budget <= filters['max_budget'])
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination and ordering
-        campaigns = query.order_by(desc(Campaign.created_at)).offset(skip).limit(limit).all()
-
-        return campaigns, total
+        return query
 
     def get_statistics(self, owner_id: Optional[UUID] = None) -> Dict[str, Any]:
         """
@@ -147,42 +265,51 @@ class CampaignRepository(BaseRepository[Campaign]):
         Returns:
             Dictionary with statistics
         """
-        query = self.db.query(Campaign)
+        with _STATISTICS_CACHE_LOCK:
+            cached = _STATISTICS_CACHE.get(owner_id)
+        if cached is not None:
+            return dict(cached)
+
+        # Status counts and financial totals in a single aggregate query
+        query = self.db.query(
+            func.count().label("total"),
+            func.count().filter(Campaign.status == CampaignStatus.DRAFT).label("draft"),
+            func.count().filter(Campaign.status == CampaignStatus.ACTIVE).label("active"),
+            func.count().filter(Campaign.status == CampaignStatus.COMPLETED).label("completed"),
+            func.sum(Campaign.budget).label("budget"),
+            func.sum(Campaign.actual_cost).label("spent"),
+            func.sum(Campaign.actual_revenue).label("revenue"),
+            func.sum(Campaign.prospects_generated).label("prospects"),
+            func.sum(Campaign.converted_count).label("conversions"),
+            func.sum(Campaign.delivered_count).label("delivered")
+        )
 
         if owner_id:
             query = query.filter(Campaign.owner_id == owner_id)
 
-        total = query.count()
-        draft = query.filter(Campaign.status == CampaignStatus.DRAFT).count()
-        active = query.filter(Campaign.status == CampaignStatus.ACTIVE).count()
-        completed = query.filter(Campaign.status == CampaignStatus.COMPLETED).count()
+        row = query.one()
+        total = row.total
+        draft = row.draft
+        active = row.active
+        completed = row.completed
 
         # Financial aggregates
-        budget_result = query.with_entities(func.sum(Campaign.budget)).scalar()
-        total_budget = float(budget_result) if budget_result else 0.0
-
-        spent_result = query.with_entities(func.sum(Campaign.actual_cost)).scalar()
-        total_spent = float(spent_result) if spent_result else 0.0
-
-        revenue_result = query.with_entities(func.sum(Campaign.actual_revenue)).scalar()
-        total_revenue = float(revenue_result) if revenue_result else 0.0
+        total_budget = float(row.budget) if row.budget else 0.0
+        total_spent = float(row.spent) if row.spent else 0.0
+        total_revenue = float(row.revenue) if row.revenue else 0.0
 
         # Calculate overall ROI
         overall_roi = ((total_revenue - total_spent) / total_spent * 100) if total_spent > 0 else 0.0
 
         # Prospect and conversion totals
-        prospects_result = query.with_entities(func.sum(Campaign.prospects_generated)).scalar()
-        total_prospects = int(prospects_result) if prospects_result else 0
-
-        conversions_result = query.with_entities(func.sum(Campaign.converted_count)).scalar()
-        total_conversions = int(conversions_result) if conversions_result else 0
+        total_prospects = int(row.prospects) if row.prospects else 0
+        total_conversions = int(row.conversions) if row.conversions else 0
 
         # Calculate average conversion rate
-        delivered_result = query.with_entities(func.sum(Campaign.delivered_count)).scalar()
-        total_delivered = int(delivered_result) if delivered_result else 0
+        total_delivered = int(row.delivered) if row.delivered else 0
         avg_conversion_rate = (total_conversions / total_delivered * 100) if total_delivered > 0 else 0.0
 
-        return {
+        statistics = {
             "total_campaigns": total,
             "draft_campaigns": draft,
             "active_campaigns": active,
@@ -196,6 +323,11 @@ class CampaignRepository(BaseRepository[Campaign]):
             "average_conversion_rate": round(avg_conversion_rate, 2)
         }
 
+        with _STATISTICS_CACHE_LOCK:
+            _STATISTICS_CACHE[owner_id] = statistics
+
+        return dict(statistics)
+
     def update_metrics(self, campaign_id: UUID) -> Optional[Campaign]:
         """
         Recalculate and update campaign metrics from campaign_contacts.
@@ -206,100 +338,163 @@ class CampaignRepository(BaseRepository[Campaign]):
         Returns:
             Updated campaign or None if not found
         """
-        campaign = self.get(campaign_id)
-        if not campaign:
-            return None
+        # Count every engagement stage in one aggregate pass
+        converted_filter = CampaignContact.converted_at.isnot(None)
+        counts = select(
+            func.count().filter(CampaignContact.sent_at.isnot(None)).label("sent"),
+            func.count().filter(CampaignContact.delivered_at.isnot(None)).label("delivered"),
+            func.count().filter(CampaignContact.opened_at.isnot(None)).label("opened"),
+            func.count().filter(CampaignContact.clicked_at.isnot(None)).label("clicked"),
+            func.count().filter(CampaignContact.responded_at.isnot(None)).label("responded"),
+            func.count().filter(CampaignContact.status == EngagementStatus.BOUNCED).label("bounced"),
+            func.count().filter(CampaignContact.status == EngagementStatus.UNSUBSCRIBED).label("unsubscribed"),
+            func.count().filter(converted_filter).label("converted"),
+            func.sum(CampaignContact.conversion_value).filter(converted_filter).label("revenue")
+        )\
+            .where(CampaignContact.campaign_id == campaign_id)\
+            .subquery()
+
+        prospects_count = select(func.count())\
+            .where(Prospect.campaign_id == campaign_id)\
+            .scalar_subquery()
+
+        # Write the aggregates straight into the campaign row and read it back
+        # in the same statement
+        campaign = self.db.scalars(
+            update(Campaign)
+            .where(Campaign.id == campaign_id)
+            .values(
+                sent_count=counts.c.sent,
+                delivered_count=counts.c.delivered,
+                opened_count=counts.c.opened,
+                clicked_count=counts.c.clicked,
+                responded_count=counts.c.responded,
+                bounced_count=counts.c.bounced,
+                unsubscribed_count=counts.c.unsubscribed,
+                converted_count=counts.c.converted,
+                prospects_generated=prospects_count,
+                actual_revenue=func.coalesce(counts.c.revenue, 0)
+            )
+            .returning(Campaign)
+            .execution_options(populate_existing=True)
+        ).first()
 
-        # Query campaign_contacts for this campaign
-        contacts = self.db.query(CampaignContact)\
-            .filter(CampaignContact.campaign_id == campaign_id)\
-            .all()
+        self.db.commit()
+        invalidate_campaign_statistics()
+
+        return campaign
 
-        # Calculate metrics
-        sent = len([c for c in contacts if c.sent_at is not None])
-        delivered = len([c for c in contacts if c.delivered_at is not None])
-        opened = len([c for c in contacts if c.opened_at is not None])
-        clicked = len([c for c in contacts if c.clicked_at is not None])
-        responded = len([c for c in contacts if c.responded_at is not None])
-        bounced = len([c for c in contacts if c.status == EngagementStatus.BOUNCED])
-        unsubscribed = len([c for c in contacts if c.status == EngagementStatus.UNSUBSCRIBED])
-        converted = len([c for c in contacts if c.converted_at is not None])
-
-        # Update campaign
-        campaign.sent_count = sent
-        campaign.delivered_count = delivered
-        campaign.opened_count = opened
-        campaign.clicked_count = clicked
-        campaign.responded_count = responded
-        campaign.bounced_count = bounced
-        campaign.unsubscribed_count = unsubscribed
-        campaign.converted_count = converted
-
-        # Count prospects generated
-        prospects_count = self.db.query(Prospect)\
-            .filter(Prospect.campaign_id == campaign_id)\
-            .count()
-        campaign.prospects_generated = prospects_count
-
-        # Calculate actual revenue from converted deals
-        revenue_result = self.db.query(func.sum(CampaignContact.conversion_value))\
+    def _conversions_query(self, campaign_id: UUID):
+        """Select the converted-recipient columns joined from deal, contact and company."""
+        return self.db.query(
+            Deal.id.label("deal_id"),
+            Deal.name.label("deal_name"),
+            Deal.value.label("deal_value"),
+            Deal.stage.label("deal_stage"),
+            CampaignContact.contact_id,
+            CampaignContact.prospect_id,
+            CampaignContact.converted_at,
+            CampaignContact.conversion_value,
+            Contact.id.label("deal_contact_id"),
+            Contact.first_name.label("contact_first_name"),
+            Contact.last_name.label("contact_last_name"),
+            Contact.email.label("contact_email"),
+            Company.id.label("company_id"),
+            Company.name.label("company_name")
+        )\
+            .select_from(CampaignContact)\
+            .join(Deal, CampaignContact.deal_id == Deal.id)\
+            .outerjoin(Contact, Deal.contact_id == Contact.id)\
+            .outerjoin(Company, Contact.company_id == Company.id)\
             .filter(CampaignContact.campaign_id == campaign_id)\
-            .filter(CampaignContact.converted_at.isnot(None))\
-            .scalar()
-        campaign.actual_revenue = Decimal(str(revenue_result)) if revenue_result else Decimal("0.00")
+            .filter(CampaignContact.converted_at.isnot(None))
+
+    @staticmethod
+    def _conversion_to_dict(row) -> Dict[str, Any]:
+        """Flatten one conversion row into the API representation."""
+        conversion_data = {
+            "deal_id": row.deal_id,
+            "deal_name": row.deal_name,
+            "deal_value": row.deal_value,
+            "deal_stage": row.deal_stage,
+            "contact_id": row.contact_id,
+            "prospect_id": row.prospect_id,
+            "converted_at": row.converted_at,
+            "conversion_value": row.conversion_value
+        }
 
-        self.db.commit()
-        self.db.refresh(campaign)
+        # Add contact information if available
+        if row.deal_contact_id is not None:
+            conversion_data["contact_name"] = f"{row.contact_first_name} {row.contact_last_name}"
+            conversion_data["contact_email"] = row.contact_email
 
-        return campaign
+        # Add company information if available
+        if row.company_id is not None:
+            conversion_data["company_name"] = row.company_name
+            conversion_data["company_id"] = row.company_id
+
+        return conversion_data
 
-    def get_conversions(self, campaign_id: UUID) -> List[Dict[str, Any]]:
+    def get_conversions(
+        self,
+        campaign_id: UUID,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
-        Get all deals/conversions from a campaign.
+        Get deals/conversions from a campaign, one page at a time.
 
         Args:
             campaign_id: Campaign UUID
+            skip: Number of records to skip
+            limit: Maximum number of records to return
 
         Returns:
-            List of conversion data with contact and company details
+            Tuple of (conversion data with contact and company details, total count)
         """
-        from app.models.contact import Contact
-        from app.models.company import Company
+        query = self._conversions_query(campaign_id)
 
-        conversions = self.db.query(CampaignContact, Deal, Contact, Company)\
-            .join(Deal, CampaignContact.deal_id == Deal.id)\
-            .outerjoin(Contact, Deal.contact_id == Contact.id)\
-            .outerjoin(Company, Contact.company_id == Company.id)\
-            .filter(CampaignContact.campaign_id == campaign_id)\
-            .filter(CampaignContact.converted_at.isnot(None))\
+        conversions = query.add_columns(func.count().over().label('total_count'))\
+            .order_by(desc(CampaignContact.converted_at))\
+            .offset(skip)\
+            .limit(limit)\
             .all()
 
-        result = []
-        for cc, deal, contact, company in conversions:
-            conversion_data = {
-                "deal_id": deal.id,
-                "deal_name": deal.name,
-                "deal_value": deal.value,
-                "deal_stage": deal.stage,
-                "contact_id": cc.contact_id,
-                "prospect_id": cc.prospect_id,
-                "converted_at": cc.converted_at,
-                "conversion_value": cc.conversion_value
-            }
+        if conversions:
+            total = conversions[0].total_count
+        else:
+            # Past the last page the window yields nothing, so count explicitly
+            total = query.count() if skip else 0
 
-            # Add contact information if available
-            if contact:
-                conversion_data["contact_name"] = f"{contact.first_name} {contact.last_name}"
-                conversion_data["contact_email"] = contact.email
+        result = [self._conversion_to_dict(row) for row in conversions]
 
-            # Add company information if available
-            if company:
-                conversion_data["company_name"] = company.name
-                conversion_data["company_id"] = company.id
+        return result, total
 
-            result.append(conversion_data)
+    def iter_conversions(
+        self,
+        campaign_id: UUID,
+        batch_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream every conversion of a campaign, for exports.
 
-        return result
+        Rows come from a server-side cursor in batches, so memory stays
+        bounded by batch_size however many conversions the campaign has.
+
+        Args:
+            campaign_id: Campaign UUID
+            batch_size: Rows fetched per round trip
+
+        Yields:
+            Conversion data with contact and company details
+        """
+        rows = self._conversions_query(campaign_id)\
+            .order_by(desc(CampaignContact.converted_at))\
+            .execution_options(stream_results=True)\
+            .yield_per(batch_size)
+
+        for row in rows:
+            yield self._conversion_to_dict(row)
 
     def get_performance_timeline(
         self,
@@ -357,35 +552,53 @@ class CampaignRepository(BaseRepository[Campaign]):
         Returns:
             List of top performers with engagement scores
         """
-        performers = self.db.query(CampaignContact)\
+        # Project only the display columns; recipients are outer-joined so
+        # no CampaignContact, Contact or Prospect objects are built
+        performers = self.db.query(
+            Contact.id.label("contact_id"),
+            Contact.first_name.label("contact_first_name"),
+            Contact.last_name.label("contact_last_name"),
+            Contact.email.label("contact_email"),
+            Prospect.id.label("prospect_id"),
+            Prospect.first_name.label("prospect_first_name"),
+            Prospect.last_name.label("prospect_last_name"),
+            Prospect.email.label("prospect_email"),
+            CampaignContact.engagement_score.label("engagement_score"),
+            CampaignContact.open_count,
+            CampaignContact.click_count,
+            CampaignContact.was_converted.label("was_converted")
+        )\
+            .select_from(CampaignContact)\
+            .outerjoin(Contact, Contact.id == CampaignContact.contact_id)\
+            .outerjoin(Prospect, Prospect.id == CampaignContact.prospect_id)\
             .filter(CampaignContact.campaign_id == campaign_id)\
             .order_by(desc(CampaignContact.open_count + CampaignContact.click_count * 2))\
             .limit(limit)\
             .all()
 
         result = []
-        for cc in performers:
-            if cc.contact:
+        for row in performers:
+            if row.contact_id is not None:
                 result.append({
                     "type": "contact",
-                    "id": cc.contact_id,
-                    "name": f"{cc.contact.first_name} {cc.contact.last_name}",
-                    "email": cc.contact.email,
-                    "engagement_score": cc.engagement_score,
-                    "opens": cc.open_count,
-                    "clicks": cc.click_count,
-                    "converted": cc.was_converted
+                    "id": row.contact_id,
+                    "name": f"{row.contact_first_name} {row.contact_last_name}",
+                    "email": row.contact_email,
+                    "engagement_score": row.engagement_score,
+                    "opens": row.open_count,
+                    "clicks": row.click_count,
+                    "converted": row.was_converted
                 })
-            elif cc.prospect:
+            elif row.prospect_id is not None:
                 result.append({
                     "type": "prospect",
-                    "id": cc.prospect_id,
-                    "name": f"{cc.prospect.first_name} {cc.prospect.last_name}",
-                    "email": cc.prospect.email,
-                    "engagement_score": cc.engagement_score,
-                    "opens": cc.open_count,
-                    "clicks": cc.click_count,
-                    "converted": cc.was_converted
+                    "id": row.prospect_id,
+                    "name": f"{row.prospect_first_name} {row.prospect_last_name}",
+                    "email": row.prospect_email,
+                    "engagement_score": row.engagement_score,
+                    "opens": row.open_count,
+                    "clicks": row.click_count,
+                    "converted": row.was_converted
                 })
 
         return result
@@ -415,6 +628,7 @@ class CampaignRepository(BaseRepository[Campaign]):
             campaign.status = CampaignStatus.ACTIVE
 
         self.db.commit()
+        invalidate_campaign_statistics()
         self.db.refresh(campaign)
 
         return campaign
@@ -6,12 +6,30 @@ Handles all database queries for integrations, logs, and webhooks.
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_, desc
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload
+from sqlalchemy import and_, or_, desc, delete, update, select, Row
 
 from .base_repository import BaseRepository
 from ..models.integration import Integration, IntegrationLog, IntegrationWebhook
 
+# Columns needed to list integrations; tokens stay in the database
+LIST_COLUMNS = (
+    Integration.id,
+    Integration.user_id,
+    Integration.provider,
+    Integration.name,
+    Integration.description,
+    Integration.status,
+    Integration.config,
+    Integration.last_sync,
+    Integration.sync_frequency,
+    Integration.auto_sync,
+    Integration.last_error,
+    Integration.error_count,
+    Integration.created_at,
+    Integration.updated_at,
+)
+
 
 class IntegrationRepository(BaseRepository[Integration]):
     """Repository for integration data access."""
@@ -32,14 +50,17 @@ class IntegrationRepository(BaseRepository[Integration]):
             include_logs: Whether to eager load logs
 
         Returns:
-            List of integrations
+            List of integrations with only the listed columns loaded (OAuth
+            tokens and expiry are deferred)
         """
-        query = self.db.query(Integration).filter(
-            Integration.user_id == user_id
-        )
+        query = self.db.query(Integration)\
+            .options(load_only(*LIST_COLUMNS))\
+            .filter(Integration.user_id == user_id)
 
         if include_logs:
             query = query.options(joinedload(Integration.logs))
+        else:
+            query = query.options(raiseload('*'))
 
         return query.order_by(Integration.created_at.desc()).all()
 
@@ -197,6 +218,78 @@ class IntegrationRepository(BaseRepository[Integration]):
         self.db.refresh(integration)
         return integration
 
+    def get_version_for_user(self, integration_id: UUID, user_id: UUID) -> Optional[Row]:
+        """
+        Get only an owned integration's updated_at, for conditional GETs.
+
+        Args:
+            integration_id: Integration UUID
+            user_id: Owner UUID
+
+        Returns:
+            Row with updated_at, or None if no owned integration matched
+        """
+        return self.db.query(Integration.updated_at)\
+            .filter(Integration.id == integration_id)\
+            .filter(Integration.user_id == user_id)\
+            .first()
+
+    def disconnect_for_user(self, integration_id: UUID, user_id: UUID) -> Optional[str]:
+        """
+        Clear tokens and mark an integration disconnected in a single UPDATE.
+
+        Args:
+            integration_id: Integration UUID
+            user_id: Owner UUID
+
+        Returns:
+            The integration's provider, or None if no owned integration matched
+        """
+        provider = self.db.execute(
+            update(Integration)
+            .where(Integration.id == integration_id, Integration.user_id == user_id)
+            .values(
+                status='disconnected',
+                access_token=None,
+                refresh_token=None,
+                expires_at=None,
+                last_error=None,
+                error_count="0"
+            )
+            .returning(Integration.provider)
+        ).scalar_one_or_none()
+        self.db.commit()
+        return provider
+
+    def delete_for_user(self, integration_id: UUID, user_id: UUID) -> bool:
+        """
+        Delete an owned integration and its logs and webhooks without loading them.
+
+        Args:
+            integration_id: Integration UUID
+            user_id: Owner UUID
+
+        Returns:
+            True if the integration was deleted, False if no owned integration matched
+        """
+        owned = select(Integration.id).where(
+            Integration.id == integration_id,
+            Integration.user_id == user_id
+        ).scalar_subquery()
+
+        self.db.execute(
+            delete(IntegrationLog).where(IntegrationLog.integration_id == owned)
+        )
+        self.db.execute(
+            delete(IntegrationWebhook).where(IntegrationWebhook.integration_id == owned)
+        )
+        deleted = self.db.execute(
+            delete(Integration)
+            .where(Integration.id == integration_id, Integration.user_id == user_id)
+        ).rowcount
+        self.db.commit()
+        return deleted > 0
+
     def update_last_sync(
         self,
         integration_id: UUID,
@@ -2,11 +2,12 @@
 Prospect repository for database operations.
 """
 
+import uuid
 from typing import Optional, List, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_, func, desc
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import or_, and_, func, desc, Row
 from sqlalchemy.exc import IntegrityError
 
 from app.models.prospect import Prospect, ProspectStatus, ProspectSource
@@ -84,7 +85,55 @@ class ProspectRepository(BaseRepository[Prospect]):
         if status:
             query = query.filter(Prospect.status.in_(status))
 
-        return query.order_by(desc(Prospect.created_at)).offset(skip).limit(limit).all()
+        return query.options(raiseload('*'))\
+            .order_by(desc(Prospect.created_at))\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+
+    def get_for_assignee(self, prospect_id: UUID, user_id: UUID) -> Optional[Prospect]:
+        """Get a prospect only if it is assigned to the given user."""
+        return self.db.query(Prospect)\
+            .filter(Prospect.id == prospect_id)\
+            .filter(Prospect.assigned_to == user_id)\
+            .first()
+
+    def get_version_for_assignee(self, prospect_id: UUID, user_id: UUID) -> Optional[Row]:
+        """
+        Get only an assigned prospect's updated_at, for conditional GETs.
+
+        Args:
+            prospect_id: Prospect UUID
+            user_id: Assignee UUID
+
+        Returns:
+            Row with updated_at, or None if no assigned prospect matched
+        """
+        return self.db.query(Prospect.updated_at)\
+            .filter(Prospect.id == prospect_id)\
+            .filter(Prospect.assigned_to == user_id)\
+            .first()
+
+    def delete_for_assignee(self, prospect_id: UUID, user_id: UUID) -> bool:
+        """
+        Delete a prospect in a single statement if it is assigned to the given user.
+
+        Child rows (campaign contacts, lead score history) are removed by the
+        ON DELETE CASCADE foreign keys.
+
+        Args:
+            prospect_id: Prospect UUID
+            user_id: Assignee UUID
+
+        Returns:
+            True if a row was deleted, False otherwise
+        """
+        deleted = self.db.query(Prospect)\
+            .filter(Prospect.id == prospect_id)\
+            .filter(Prospect.assigned_to == user_id)\
+            .delete(synchronize_session=False)
+        self.db.commit()
+        return deleted > 0
 
     def get_by_status(
         self,
@@ -115,6 +164,7 @@ class ProspectRepository(BaseRepository[Prospect]):
         cutoff_date = datetime.utcnow() - timedelta(days=days)
 
         return self.db.query(Prospect)\
+            .options(raiseload('*'))\
             .filter(Prospect.created_at >= cutoff_date)\
             .order_by(desc(Prospect.created_at))\
             .limit(limit)\
@@ -139,8 +189,59 @@ class ProspectRepository(BaseRepository[Prospect]):
         Returns:
             Tuple of (list of prospects, total count)
         """
-        query = self.db.query(Prospect)
+        query = self._apply_search_filters(self.db.query(Prospect), search_term, filters)
+
+        # Get total count before pagination
+        total = query.count()
+
+        # Apply pagination and ordering. List responses only read columns, so
+        # refuse any relationship lazy load instead of issuing one query per row.
+        prospects = query.options(raiseload('*'))\
+            .order_by(desc(Prospect.created_at))\
+            .offset(skip)\
+            .limit(limit)\
+            .all()
+
+        return prospects, total
+
+    def search_page(
+        self,
+        search_term: str,
+        filters: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Prospect], bool]:
+        """
+        Search prospects without counting the full result set.
+
+        Fetches one row past the page to tell whether another page exists.
+
+        Args:
+            search_term: Text to search for
+            filters: Additional filters (status, source, campaign_id, etc.)
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (list of prospects, whether more records follow)
+        """
+        query = self._apply_search_filters(self.db.query(Prospect), search_term, filters)
+
+        prospects = query.options(raiseload('*'))\
+            .order_by(desc(Prospect.created_at))\
+            .offset(skip)\
+            .limit(limit + 1)\
+            .all()
+
+        return prospects[:limit], len(prospects) > limit
 
+    def _apply_search_filters(
+        self,
+        query,
+        search_term: str,
+        filters: Optional[Dict[str, Any]] = None
+    ):
+        """Apply the search term and additional filters used by search()/search_page()."""
         # Search in name, email, company
         if search_term:
             search_filter = or_(
@@ -183,13 +284,7 @@ class ProspectRepository(BaseRepository[Prospect]):
             if 'created_before' in filters and filters['created_before']:
                 query = query.filter(Prospect.created_at <= filters['created_before'])
 
-        # Get total count before pagination
-        total = query.count()
-
-        # Apply pagination and ordering
-        prospects = query.order_by(desc(Prospect.created_at)).offset(skip).limit(limit).all()
-
-        return prospects, total
+        return query
 
     def get_statistics(self, campaign_id: Optional[UUID] = None) -> Dict[str, Any]:
         """
@@ -311,6 +406,11 @@ class ProspectRepository(BaseRepository[Prospect]):
         """
         Bulk create prospects with duplicate handling.
 
+        Duplicates are found with one lookup for the whole batch and the
+        remaining rows are inserted in a single flush. If that flush still
+        fails (e.g. a concurrent insert), falls back to row-by-row creation so
+        each failure is reported against its own row.
+
         Args:
             prospects_data: List of prospect dictionaries
             skip_duplicates: If True, skip duplicates; if False, raise error
@@ -318,6 +418,79 @@ class ProspectRepository(BaseRepository[Prospect]):
         Returns:
             Dictionary with results (created_count, skipped_count, created_ids, errors)
         """
+        errors = []
+        skipped_count = 0
+
+        emails = {p['email'] for p in prospects_data if p.get('email')}
+        phones = {p['phone'] for p in prospects_data if p.get('phone')}
+        existing_by_email: Dict[str, UUID] = {}
+        existing_by_phone: Dict[str, UUID] = {}
+        if emails or phones:
+            conditions = []
+            if emails:
+                conditions.append(Prospect.email.in_(emails))
+            if phones:
+                conditions.append(Prospect.phone.in_(phones))
+            for prospect_id, email, phone in self.db.query(Prospect.id, Prospect.email, Prospect.phone)\
+                    .filter(or_(*conditions))\
+                    .all():
+                if email:
+                    existing_by_email.setdefault(email, prospect_id)
+                if phone:
+                    existing_by_phone.setdefault(phone, prospect_id)
+
+        to_create = []
+        created_ids = []
+        for idx, prospect_data in enumerate(prospects_data):
+            email = prospect_data.get('email')
+            phone = prospect_data.get('phone')
+            duplicate_id = (email and existing_by_email.get(email)) or \
+                (phone and existing_by_phone.get(phone))
+
+            if duplicate_id:
+                if skip_duplicates:
+                    skipped_count += 1
+                    errors.append({
+                        "row": idx + 1,
+                        "email": email,
+                        "error": f"Duplicate: Prospect with email/phone already exists (ID: {duplicate_id})"
+                    })
+                else:
+                    errors.append({
+                        "row": idx + 1,
+                        "email": email,
+                        "error": f"Duplicate prospect: {email}"
+                    })
+                continue
+
+            # Assign the id up front so it is known without a post-commit refresh
+            prospect_id = uuid.uuid4()
+            to_create.append(Prospect(id=prospect_id, **prospect_data))
+            created_ids.append(prospect_id)
+
+            # Later rows in the same batch must see this one as a duplicate
+            if email:
+                existing_by_email[email] = prospect_id
+            if phone:
+                existing_by_phone[phone] = prospect_id
+
+        try:
+            self.db.add_all(to_create)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            return self._bulk_create_row_by_row(prospects_data, skip_duplicates)
+
+        return {
+            "created_count": len(created_ids),
+            "skipped_count": skipped_count,
+            "failed_count": len(errors) - skipped_count,
+            "created_ids": created_ids,
+            "errors": errors
+        }
+
+    def _bulk_create_row_by_row(self, prospects_data: List[Dict[str, Any]], skip_duplicates: bool = True) -> Dict[str, Any]:
+        """Create prospects one at a time, recording a per-row error for each failure."""
         created_ids = []
         errors = []
         skipped_count = 0
@@ -5,7 +5,7 @@ Handles all database queries for role-based access control (RBAC).
 
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import func
 
 from ..repositories.base_repository import BaseRepository
@@ -63,6 +63,23 @@ class RoleRepository(BaseRepository[Role]):
             joinedload(Role.permissions)
         ).filter(Role.is_active == True).all()
 
+    def _reload_with_permissions(self, role: Role) -> Role:
+        """
+        Reload a role after commit with its permissions eagerly loaded.
+
+        Replaces db.refresh(role), which leaves role.permissions expired so
+        that the caller's first iteration fires a separate lazy SELECT.
+
+        Args:
+            role: Role object (expired by the preceding commit)
+
+        Returns:
+            The same role instance with fresh columns and permissions
+        """
+        return self.db.query(Role).options(
+            selectinload(Role.permissions)
+        ).populate_existing().filter(Role.id == role.id).one()
+
     def add_permission_to_role(self, role: Role, permission: Permission) -> Role:
         """
         Add a permission to a role.
@@ -77,7 +94,7 @@ class RoleRepository(BaseRepository[Role]):
         if permission not in role.permissions:
             role.permissions.append(permission)
             self.db.commit()
-            self.db.refresh(role)
+            role = self._reload_with_permissions(role)
 
         return role
 
@@ -95,7 +112,7 @@ class RoleRepository(BaseRepository[Role]):
         if permission in role.permissions:
             role.permissions.remove(permission)
             self.db.commit()
-            self.db.refresh(role)
+            role = self._reload_with_permissions(role)
 
         return role
 
@@ -126,7 +143,7 @@ class RoleRepository(BaseRepository[Role]):
             role.permissions.extend(permissions)
 
         self.db.commit()
-        self.db.refresh(role)
+        role = self._reload_with_permissions(role)
 
         return role
 
@@ -162,10 +179,28 @@ class RoleRepository(BaseRepository[Role]):
             role.permissions.extend(permissions)
 
         self.db.commit()
-        self.db.refresh(role)
 
         return role
 
+    def get_permission_names(self, role_id: UUID) -> List[str]:
+        """
+        Get the names of a role's active permissions without loading Permission objects.
+
+        Args:
+            role_id: Role UUID
+
+        Returns:
+            List of permission names
+        """
+        rows = self.db.query(Permission.name)\
+            .join(role_permissions, role_permissions.c.permission_id == Permission.id)\
+            .filter(
+                role_permissions.c.role_id == role_id,
+                Permission.is_active == True
+            )\
+            .all()
+        return [name for (name,) in rows]
+
     def get_role_statistics(self) -> Dict[str, int]:
         """
         Get role statistics.
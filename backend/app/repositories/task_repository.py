@@ -3,11 +3,11 @@ Task Repository - Data access layer for Task entity.
 Handles all database operations for tasks.
 """
 
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, update
 
 from ..models.task import Task
 from .base_repository import BaseRepository
@@ -35,6 +35,61 @@ class TaskRepository(BaseRepository[Task]):
             joinedload(Task.creator)
         ).filter(Task.id == task_id).first()
 
+    def get_for_assignee(self, task_id: UUID, user_id: UUID) -> Optional[Task]:
+        """Get a task only if it is assigned to the given user."""
+        return self.db.query(Task)\
+            .filter(Task.id == task_id)\
+            .filter(Task.assigned_to == user_id)\
+            .first()
+
+    def update_for_assignee(
+        self,
+        task_id: UUID,
+        user_id: UUID,
+        obj_in: Dict[str, Any]
+    ) -> Optional[Task]:
+        """
+        Update a task in a single UPDATE ... RETURNING if it is assigned to the given user.
+
+        Args:
+            task_id: UUID of the task
+            user_id: Assignee UUID
+            obj_in: Dictionary of attributes to update
+
+        Returns:
+            Updated task, or None if no assigned task matched
+        """
+        values = {field: value for field, value in obj_in.items() if hasattr(Task, field)}
+        if not values:
+            return self.get_for_assignee(task_id, user_id)
+
+        task = self.db.scalars(
+            update(Task)
+            .where(Task.id == task_id, Task.assigned_to == user_id)
+            .values(**values)
+            .returning(Task)
+        ).first()
+        self.db.commit()
+        return task
+
+    def delete_for_assignee(self, task_id: UUID, user_id: UUID) -> bool:
+        """
+        Delete a task in a single statement if it is assigned to the given user.
+
+        Args:
+            task_id: UUID of the task
+            user_id: Assignee UUID
+
+        Returns:
+            True if a row was deleted, False otherwise
+        """
+        deleted = self.db.query(Task)\
+            .filter(Task.id == task_id)\
+            .filter(Task.assigned_to == user_id)\
+            .delete(synchronize_session=False)
+        self.db.commit()
+        return deleted > 0
+
     def get_user_tasks(
         self,
         assigned_to: UUID,
@@ -92,20 +147,21 @@ class TaskRepository(BaseRepository[Task]):
 
         return query.order_by(Task.due_date.asc().nullslast()).all()
 
-    def get_tasks_by_contact(self, contact_id: UUID) -> List[Task]:
+    def get_tasks_by_contact_for_user(self, contact_id: UUID, user_id: UUID) -> List[Task]:
         """
-        Get all tasks related to a specific contact.
+        Get a contact's tasks that the user is assigned to or created.
 
         Args:
             contact_id: Contact UUID
+            user_id: User UUID
 
         Returns:
             List of tasks
         """
-        return self.db.query(Task).options(
-            joinedload(Task.assigned_user),
-            joinedload(Task.creator)
-        ).filter(Task.contact_id == contact_id).all()
+        return self.db.query(Task).filter(
+            Task.contact_id == contact_id,
+            or_(Task.assigned_to == user_id, Task.created_by == user_id)
+        ).all()
 
     def get_overdue_tasks(self, assigned_to: UUID) -> List[Task]:
         """
@@ -4,9 +4,9 @@ from sqlalchemy.orm import Session
 from datetime import timedelta
 from typing import List, Dict, Optional
 from ..core.database import get_db
-from ..core.security import create_access_token, verify_password, get_password_hash
+from ..core.security import create_access_token, averify_password, aget_password_hash, password_needs_rehash
 from ..core.config import settings
-from ..core.auth import get_current_user, get_user_permissions
+from ..core.auth import get_current_user, get_user_permissions, invalidate_cached_user
 from ..models.user import UserProfile
 from ..models.password_reset_token import PasswordResetToken
 from ..schemas.user import (
@@ -148,7 +148,7 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             db.commit()
 
     # Verify password
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    if not user or not await averify_password(user_credentials.password, user.hashed_password):
         # Track failed login attempt
         if user:
             user.failed_login_attempts = (user.failed_login_attempts or 0) + 1
@@ -182,6 +182,11 @@ async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     # Successful login - reset failed attempts
     user.failed_login_attempts = 0
     user.account_locked_until = None
+
+    # Upgrade the stored hash if BCRYPT_ROUNDS has changed since it was made
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await aget_password_hash(user_credentials.password)
+        invalidate_cached_user(user.id)
     db.commit()
 
     # Create access token with session timeout from system configuration
@@ -412,12 +417,13 @@ async def reset_password(
         )
 
     # Update user's password
-    user.hashed_password = get_password_hash(request.new_password)
+    user.hashed_password = await aget_password_hash(request.new_password)
 
     # Mark token as used
     reset_token.mark_as_used()
 
     db.commit()
+    invalidate_cached_user(user.id)
 
     # Send confirmation email (optional)
     try:
@@ -27,12 +27,14 @@ router = APIRouter()
     description="Retrieve campaigns with optional filters"
 )
 async def get_campaigns(
-    status: Optional[str] = Query(
+    status_filter: Optional[str] = Query(
         None,
+        alias="status",
         description="Filter by status (comma-separated): draft, scheduled, active, completed, paused, cancelled"
     ),
-    type: Optional[str] = Query(
+    type_filter: Optional[str] = Query(
         None,
+        alias="type",
         description="Filter by type (comma-separated): email, web_form, phone, social_media, manual_entry"
     ),
     search: Optional[str] = Query(
@@ -41,6 +43,7 @@ async def get_campaigns(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of records to return"),
+    summary: bool = Query(False, description="Return lightweight rows without performance metrics"),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -52,11 +55,12 @@ async def get_campaigns(
     - **search**: Search in campaign name or description
     - **skip**: Pagination offset
     - **limit**: Pagination limit (max 500)
+    - **summary**: Only return id, name, status, type, owner, audience size and creation date
 
     Returns campaigns with performance metrics.
     """
     controller = CampaignController(db)
-    return await controller.get_campaigns(current_user, status, type, search, skip, limit)
+    return await controller.get_campaigns(current_user, status_filter, type_filter, search, skip, limit, summary)
 
 
 @router.get(
@@ -218,8 +222,9 @@ async def add_audience_to_campaign(
 )
 async def get_campaign_audience(
     campaign_id: UUID,
-    status: Optional[str] = Query(
+    status_filter: Optional[str] = Query(
         None,
+        alias="status",
         description="Filter by engagement status (comma-separated)"
     ),
     skip: int = Query(0, ge=0),
@@ -238,7 +243,7 @@ async def get_campaign_audience(
     - Engagement scores
     """
     controller = CampaignController(db)
-    return await controller.get_audience(campaign_id, current_user, status, skip, limit)
+    return await controller.get_audience(campaign_id, current_user, status_filter, skip, limit)
 
 
 @router.delete(
@@ -434,6 +439,8 @@ async def get_campaign_metrics(
 )
 async def get_campaign_conversions(
     campaign_id: UUID,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=500),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -446,7 +453,7 @@ async def get_campaign_conversions(
     - Conversion timestamp
     """
     controller = CampaignController(db)
-    return await controller.get_conversions(campaign_id, current_user)
+    return await controller.get_conversions(campaign_id, current_user, skip, limit)
 
 
 @router.get(
@@ -473,12 +480,33 @@ async def get_campaign_analytics(
     return await controller.get_analytics(campaign_id, current_user, days)
 
 
+@router.get(
+    "/{campaign_id}/dashboard",
+    summary="Get campaign dashboard",
+    description="Get metrics, analytics and conversions for a campaign in one request"
+)
+async def get_campaign_dashboard(
+    campaign_id: UUID,
+    days: int = Query(30, ge=1, le=365, description="Number of days for time-series data"),
+    db: Session = Depends(get_db),
+    current_user: UserProfile = Depends(get_current_user)
+):
+    """
+    Get everything a campaign dashboard needs with a single authorization check.
+
+    Returns the analytics payload (metrics, time series, top performers and
+    conversion funnel) plus the first page of conversions and their total.
+    """
+    controller = CampaignController(db)
+    return await controller.get_dashboard(campaign_id, current_user, days)
+
+
 @router.get(
     "/{campaign_id}/prospects",
     summary="Get campaign prospects",
     description="Get all prospects generated by this campaign"
 )
-async def get_campaign_prospects(
+def get_campaign_prospects(
     campaign_id: UUID,
     status: Optional[str] = Query(
         None,
@@ -497,7 +525,7 @@ async def get_campaign_prospects(
     """
     from app.controllers.prospect_controller import ProspectController
     controller = ProspectController(db)
-    return await controller.get_campaign_prospects(campaign_id, current_user, status, skip, limit)
+    return controller.get_campaign_prospects(campaign_id, current_user, status, skip, limit)
 
 
 @router.post(
@@ -5,7 +5,8 @@ All business logic is in IntegrationController.
 
 from typing import List, Dict, Any, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Header
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
@@ -25,8 +26,8 @@ router = APIRouter()
 
 # ==================== INTEGRATION ENDPOINTS ====================
 
-@router.get("/", response_model=List[IntegrationResponse])
-async def get_integrations(
+@router.get("/", response_model=List[IntegrationResponse], response_class=ORJSONResponse)
+def get_integrations(
     include_logs: bool = Query(False, description="Include integration logs"),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -48,7 +49,7 @@ async def get_integrations(
 
 
 @router.get("/providers")
-async def get_supported_providers(
+def get_supported_providers(
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -70,7 +71,7 @@ async def get_supported_providers(
 
 
 @router.get("/stats")
-async def get_integration_statistics(
+def get_integration_statistics(
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -88,7 +89,7 @@ async def get_integration_statistics(
 
 
 @router.get("/provider/{provider}", response_model=IntegrationResponse)
-async def get_integration_by_provider(
+def get_integration_by_provider(
     provider: str,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -117,9 +118,10 @@ async def get_integration_by_provider(
     return integration
 
 
-@router.get("/{integration_id}", response_model=IntegrationResponse)
-async def get_integration(
+@router.get("/{integration_id}", response_model=IntegrationResponse, response_class=ORJSONResponse)
+def get_integration(
     integration_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -133,13 +135,15 @@ async def get_integration(
     - Complete integration details
     - Configuration and status
     - Last sync information
+
+    Sends a weak ETag; repeat requests with If-None-Match get 304 when unchanged.
     """
     controller = IntegrationController(db)
-    return controller.get_integration(integration_id, current_user)
+    return controller.get_integration(integration_id, current_user, if_none_match)
 
 
 @router.post("/", response_model=IntegrationResponse, status_code=201)
-async def create_integration(
+def create_integration(
     integration_data: IntegrationCreate,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -167,7 +171,7 @@ async def create_integration(
 
 
 @router.put("/{integration_id}", response_model=IntegrationResponse)
-async def update_integration(
+def update_integration(
     integration_id: UUID,
     integration_data: IntegrationUpdate,
     db: Session = Depends(get_db),
@@ -197,7 +201,7 @@ async def update_integration(
 
 
 @router.delete("/{integration_id}")
-async def delete_integration(
+def delete_integration(
     integration_id: UUID,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -223,7 +227,7 @@ async def delete_integration(
 # ==================== CONNECTION MANAGEMENT ====================
 
 @router.post("/{integration_id}/connect", response_model=IntegrationResponse)
-async def connect_integration(
+def connect_integration(
     integration_id: UUID,
     access_token: str,
     refresh_token: Optional[str] = None,
@@ -260,7 +264,7 @@ async def connect_integration(
 
 
 @router.post("/{integration_id}/disconnect")
-async def disconnect_integration(
+def disconnect_integration(
     integration_id: UUID,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -285,7 +289,7 @@ async def disconnect_integration(
 
 
 @router.post("/{integration_id}/test")
-async def test_integration(
+def test_integration(
     integration_id: UUID,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -317,7 +321,7 @@ async def test_integration(
 # ==================== SYNC OPERATIONS ====================
 
 @router.post("/{integration_id}/sync")
-async def sync_integration(
+def sync_integration(
     integration_id: UUID,
     force: bool = Query(
         False, description="Force sync even if recently synced"),
@@ -356,7 +360,7 @@ async def sync_integration(
 
 
 @router.get("/{integration_id}/sync/stats")
-async def get_sync_statistics(
+def get_sync_statistics(
     integration_id: UUID,
     days: int = Query(30, ge=1, le=365,
                       description="Number of days to analyze"),
@@ -389,8 +393,8 @@ async def get_sync_statistics(
 
 # ==================== LOGS ====================
 
-@router.get("/{integration_id}/logs", response_model=List[IntegrationLogResponse])
-async def get_integration_logs(
+@router.get("/{integration_id}/logs", response_model=List[IntegrationLogResponse], response_class=ORJSONResponse)
+def get_integration_logs(
     integration_id: UUID,
     limit: int = Query(50, ge=1, le=100, description="Maximum results"),
     offset: int = Query(0, ge=0, description="Results offset"),
@@ -5,7 +5,7 @@ Clean endpoint definitions using the controller layer.
 
 from typing import Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Header
 from sqlalchemy.orm import Session
 
 from app.controllers.prospect_controller import ProspectController
@@ -26,7 +26,7 @@ router = APIRouter()
     summary="Get all prospects",
     description="Retrieve prospects with optional filters"
 )
-async def get_prospects(
+def get_prospects(
     status: Optional[str] = Query(
         None,
         description="Filter by status (comma-separated): new, contacted, qualified, converted, rejected"
@@ -45,6 +45,7 @@ async def get_prospects(
     ),
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum number of records to return"),
+    count: bool = Query(False, description="Include the total match count instead of has_more"),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -57,12 +58,13 @@ async def get_prospects(
     - **search**: Search in name, email, or company name
     - **skip**: Pagination offset
     - **limit**: Pagination limit (max 500)
+    - **count**: Return `total` (runs a COUNT query) instead of `has_more`
 
     Returns prospects with lead scores and conversion status.
     """
     controller = ProspectController(db)
-    return await controller.get_prospects(
-        current_user, status, source, campaign_id, search, skip, limit
+    return controller.get_prospects(
+        current_user, status, source, campaign_id, search, skip, limit, count
     )
 
 
@@ -71,7 +73,7 @@ async def get_prospects(
     summary="Get recent prospects",
     description="Get recently created prospects across all campaigns"
 )
-async def get_recent_prospects(
+def get_recent_prospects(
     days: int = Query(7, ge=1, le=90, description="Number of days to look back"),
     limit: int = Query(10, ge=1, le=100, description="Maximum number of prospects"),
     db: Session = Depends(get_db),
@@ -86,7 +88,7 @@ async def get_recent_prospects(
     - **limit**: Maximum number of prospects to return (default 10)
     """
     controller = ProspectController(db)
-    return await controller.get_recent_prospects(current_user, days, limit)
+    return controller.get_recent_prospects(current_user, days, limit)
 
 
 @router.get(
@@ -94,7 +96,7 @@ async def get_recent_prospects(
     summary="Get prospect statistics",
     description="Get prospect statistics, optionally filtered by campaign"
 )
-async def get_prospect_statistics(
+def get_prospect_statistics(
     campaign_id: Optional[UUID] = Query(None, description="Optional campaign ID filter"),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -108,7 +110,7 @@ async def get_prospect_statistics(
     - Conversion rate
     """
     controller = ProspectController(db)
-    return await controller.get_prospect_statistics(current_user, campaign_id)
+    return controller.get_prospect_statistics(current_user, campaign_id)
 
 
 @router.get(
@@ -117,8 +119,9 @@ async def get_prospect_statistics(
     summary="Get prospect by ID",
     description="Retrieve a single prospect with full details"
 )
-async def get_prospect_by_id(
+def get_prospect_by_id(
     prospect_id: UUID,
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
 ):
@@ -130,9 +133,11 @@ async def get_prospect_by_id(
     - Lead score
     - Campaign source
     - Conversion status
+
+    Sends a weak ETag; repeat requests with If-None-Match get 304 when unchanged.
     """
     controller = ProspectController(db)
-    return await controller.get_prospect(prospect_id, current_user)
+    return controller.get_prospect(prospect_id, current_user, if_none_match)
 
 
 @router.post(
@@ -142,7 +147,7 @@ async def get_prospect_by_id(
     summary="Create a new prospect",
     description="Create a new prospect with duplicate detection"
 )
-async def create_prospect(
+def create_prospect(
     prospect_data: ProspectCreate,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -169,7 +174,7 @@ async def create_prospect(
     ```
     """
     controller = ProspectController(db)
-    return await controller.create_prospect(prospect_data, current_user)
+    return controller.create_prospect(prospect_data, current_user)
 
 
 @router.post(
@@ -177,7 +182,7 @@ async def create_prospect(
     summary="Bulk create prospects",
     description="Create multiple prospects at once with duplicate handling"
 )
-async def bulk_create_prospects(
+def bulk_create_prospects(
     bulk_data: BulkProspectCreate,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -218,7 +223,7 @@ async def bulk_create_prospects(
     - errors: List of errors encountered
     """
     controller = ProspectController(db)
-    return await controller.bulk_create_prospects(bulk_data, current_user)
+    return controller.bulk_create_prospects(bulk_data, current_user)
 
 
 @router.put(
@@ -227,7 +232,7 @@ async def bulk_create_prospects(
     summary="Update a prospect",
     description="Update an existing prospect's information"
 )
-async def update_prospect(
+def update_prospect(
     prospect_id: UUID,
     prospect_data: ProspectUpdate,
     db: Session = Depends(get_db),
@@ -241,7 +246,7 @@ async def update_prospect(
     Note: Changing lead_score will create a history record.
     """
     controller = ProspectController(db)
-    return await controller.update_prospect(prospect_id, prospect_data, current_user)
+    return controller.update_prospect(prospect_id, prospect_data, current_user)
 
 
 @router.delete(
@@ -249,7 +254,7 @@ async def update_prospect(
     summary="Delete a prospect",
     description="Delete a prospect"
 )
-async def delete_prospect(
+def delete_prospect(
     prospect_id: UUID,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -265,7 +270,7 @@ async def delete_prospect(
     the contact will NOT be deleted.
     """
     controller = ProspectController(db)
-    return await controller.delete_prospect(prospect_id, current_user)
+    return controller.delete_prospect(prospect_id, current_user)
 
 
 @router.post(
@@ -273,7 +278,7 @@ async def delete_prospect(
     summary="Convert prospect to contact",
     description="Convert a qualified prospect to a contact"
 )
-async def convert_prospect_to_contact(
+def convert_prospect_to_contact(
     prospect_id: UUID,
     conversion_request: ProspectConversionRequest,
     db: Session = Depends(get_db),
@@ -304,4 +309,4 @@ async def convert_prospect_to_contact(
     - message: Success message
     """
     controller = ProspectController(db)
-    return await controller.convert_to_contact(prospect_id, conversion_request, current_user)
+    return controller.convert_to_contact(prospect_id, conversion_request, current_user)
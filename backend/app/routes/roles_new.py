@@ -1,6 +1,7 @@
 """
 Role Routes - Clean API endpoint definitions for Roles and Permissions.
 All business logic is in RoleController and PermissionController.
+Every endpoint here is admin only; the check is applied once on the router.
 """
 
 from typing import List, Dict, Any
@@ -9,7 +10,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from ..core.database import get_db
-from ..core.auth import get_current_user
+from ..core.auth import get_current_user, require_admin
 from ..models.user import UserProfile
 from ..controllers.role_controller import RoleController, PermissionController
 from ..schemas.role import (
@@ -17,7 +18,7 @@ from ..schemas.role import (
     PermissionResponse, RolePermissionUpdate
 )
 
-router = APIRouter()
+router = APIRouter(dependencies=[Depends(require_admin())])
 
 
 # ==================== ROLE ENDPOINTS ====================
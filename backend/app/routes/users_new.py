@@ -93,7 +93,7 @@ async def update_current_user_profile(
 
 
 @router.post("/me/change-password")
-async def change_password(
+def change_password(
     password_data: PasswordChange,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -136,7 +136,7 @@ async def get_user_statistics(
 
 
 @router.post("/invite", response_model=UserResponse, status_code=201)
-async def invite_user(
+def invite_user(
     invite_data: UserInvite,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -184,7 +184,7 @@ async def get_user(
 
 
 @router.post("/", response_model=UserResponse, status_code=201)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     db: Session = Depends(get_db),
     current_user: UserProfile = Depends(get_current_user)
@@ -281,7 +281,7 @@ async def activate_user(
 
 
 @router.post("/{user_id}/reset-password")
-async def reset_user_password(
+def reset_user_password(
     user_id: UUID,
     password_data: PasswordReset,
     db: Session = Depends(get_db),
@@ -114,6 +114,22 @@ class CampaignWithStats(CampaignResponse):
     is_active: bool = False
     is_scheduled: bool = False
     is_draft: bool = False
+    email_template_name: Optional[str] = None
+
+
+# Campaign Summary (lightweight list item without stats)
+class CampaignSummary(BaseModel):
+    """Minimal campaign representation for index listings"""
+    id: UUID
+    name: str
+    status: CampaignStatus
+    type: CampaignType
+    owner_id: UUID
+    target_audience_size: Optional[int] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
 
 
 # Campaign Detail (includes related data)
@@ -0,0 +1,91 @@
+"""
+Helpers for building response schemas from ORM objects.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+ResponseModel = TypeVar("ResponseModel", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _response_fields(model_cls: Type[BaseModel]) -> Tuple[str, ...]:
+    """Field names of a response schema, computed once per class."""
+    return tuple(model_cls.model_fields)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    """List[model_cls] validator, built once per class."""
+    return TypeAdapter(List[model_cls])
+
+
+def orm_to_dict(model_cls: Type[BaseModel], orm_obj: Any) -> Dict[str, Any]:
+    """
+    Read a response schema's fields off an ORM row into a plain dict.
+
+    Values are left as native Python types (UUID, datetime, enums), ready to
+    be serialized directly by ORJSONResponse.
+
+    Args:
+        model_cls: Pydantic response schema class
+        orm_obj: SQLAlchemy model instance
+
+    Returns:
+        Dictionary keyed by the schema's field names
+    """
+    return {field: getattr(orm_obj, field) for field in _response_fields(model_cls)}
+
+
+def orm_list_to_dicts(model_cls: Type[BaseModel], orm_objs: Iterable[Any]) -> List[Dict[str, Any]]:
+    """
+    Like orm_to_dict for a whole page of rows, resolving the field names once.
+
+    Args:
+        model_cls: Pydantic response schema class
+        orm_objs: SQLAlchemy model instances
+
+    Returns:
+        List of dictionaries keyed by the schema's field names
+    """
+    fields = _response_fields(model_cls)
+    return [{field: getattr(obj, field) for field in fields} for obj in orm_objs]
+
+
+def orm_to_response(model_cls: Type[ResponseModel], orm_obj: Any) -> ResponseModel:
+    """
+    Build a response schema from an ORM row without re-running validation.
+
+    Only use this for trusted DB sources whose column types already match the
+    schema; values are copied as-is via model_construct.
+
+    Args:
+        model_cls: Pydantic response schema class
+        orm_obj: SQLAlchemy model instance
+
+    Returns:
+        Response schema instance
+    """
+    return model_cls.model_construct(
+        _fields_set=set(_response_fields(model_cls)),
+        **orm_to_dict(model_cls, orm_obj)
+    )
+
+
+def validate_orm_list(model_cls: Type[ResponseModel], orm_objs: Iterable[Any]) -> List[ResponseModel]:
+    """
+    Validate a list of ORM rows into response schemas in a single call.
+
+    Equivalent to [model_cls.model_validate(obj) for obj in orm_objs], but the
+    whole list is handed to pydantic-core at once instead of item by item.
+
+    Args:
+        model_cls: Pydantic response schema class
+        orm_objs: SQLAlchemy model instances
+
+    Returns:
+        List of response schema instances
+    """
+    return _list_adapter(model_cls).validate_python(list(orm_objs), from_attributes=True)
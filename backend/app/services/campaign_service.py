@@ -9,7 +9,7 @@ from datetime import datetime
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
-from app.repositories.campaign_repository import CampaignRepository
+from app.repositories.campaign_repository import CampaignRepository, invalidate_campaign_statistics
 from app.repositories.campaign_contact_repository import CampaignContactRepository
 from app.repositories.prospect_repository import ProspectRepository
 from app.models.campaign import Campaign, CampaignStatus, CampaignType
@@ -70,6 +70,10 @@ class CampaignService:
         """Get a campaign by ID."""
         return self.repository.get(campaign_id)
 
+    def get_campaign_with_template(self, campaign_id: UUID) -> Optional[Campaign]:
+        """Get a campaign by ID with its email template eager-loaded."""
+        return self.repository.get_with_template(campaign_id)
+
     def get_campaigns(
         self,
         filters: CampaignFilter,
@@ -97,6 +101,33 @@ class CampaignService:
             limit=limit
         )
 
+    def get_campaign_summaries(
+        self,
+        filters: CampaignFilter,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Any], int]:
+        """
+        Get lightweight campaign rows (no stats, no template) for list views.
+
+        Args:
+            filters: Filter criteria
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (summary rows, total count)
+        """
+        filter_dict = filters.dict(exclude_none=True)
+        search_term = filter_dict.pop('search', '')
+
+        return self.repository.search_summaries(
+            search_term=search_term,
+            filters=filter_dict,
+            skip=skip,
+            limit=limit
+        )
+
     def get_user_campaigns(
         self,
         owner_id: UUID,
@@ -205,7 +236,7 @@ class CampaignService:
             added_prospects = result['added_count']
 
         # Update campaign target audience size
-        total_audience = len(self.campaign_contact_repo.get_campaign_audience(campaign_id))
+        total_audience = self.campaign_contact_repo.count_campaign_audience(campaign_id)
         campaign.target_audience_size = total_audience
         self.db.commit()
 
@@ -223,7 +254,7 @@ class CampaignService:
         status: Optional[List[EngagementStatus]] = None,
         skip: int = 0,
         limit: int = 100
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Get campaign audience members with details.
 
@@ -234,9 +265,9 @@ class CampaignService:
             limit: Maximum number of records to return
 
         Returns:
-            List of audience member details
+            Tuple of (audience member details for the page, total matching count)
         """
-        audience_members = self.campaign_contact_repo.get_campaign_audience(
+        audience_members, total = self.campaign_contact_repo.get_campaign_audience_page(
             campaign_id=campaign_id,
             status=status,
             skip=skip,
@@ -274,7 +305,7 @@ class CampaignService:
 
             result.append(member_data)
 
-        return result
+        return result, total
 
     def remove_audience_member(
         self,
@@ -396,6 +427,7 @@ class CampaignService:
             campaign.status = CampaignStatus.SCHEDULED
             campaign.start_date = execute_request.schedule_for
             self.db.commit()
+            invalidate_campaign_statistics()
 
             return {
                 "campaign_id": campaign_id,
@@ -411,9 +443,9 @@ class CampaignService:
             sent_count = self._execute_email_campaign(campaign, audience)
         else:
             # For non-email campaigns, just mark as sent
-            for cc in audience:
-                self.campaign_contact_repo.mark_as_sent(cc.id)
-                sent_count += 1
+            sent_count = self.campaign_contact_repo.mark_many_as_sent(
+                [cc.id for cc in audience]
+            )
 
         # Mark campaign as executed
         self.repository.mark_as_executed(campaign_id)
@@ -481,9 +513,9 @@ class CampaignService:
             sent_count = self._execute_email_campaign(campaign, pending_audience)
         else:
             # For non-email campaigns, just mark as sent
-            for cc in pending_audience:
-                self.campaign_contact_repo.mark_as_sent(cc.id)
-                sent_count += 1
+            sent_count = self.campaign_contact_repo.mark_many_as_sent(
+                [cc.id for cc in pending_audience]
+            )
 
         # Update metrics
         self.repository.update_metrics(campaign_id)
@@ -629,9 +661,14 @@ class CampaignService:
             "roi": campaign.roi
         }
 
-    def get_campaign_conversions(self, campaign_id: UUID) -> List[Dict[str, Any]]:
-        """Get all deals/conversions from a campaign."""
-        return self.repository.get_conversions(campaign_id)
+    def get_campaign_conversions(
+        self,
+        campaign_id: UUID,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get a page of deals/conversions from a campaign with the total count."""
+        return self.repository.get_conversions(campaign_id, skip=skip, limit=limit)
 
     def get_campaign_analytics(
         self,
@@ -677,6 +714,32 @@ class CampaignService:
             "conversion_funnel": funnel
         }
 
+    def get_campaign_dashboard(
+        self,
+        campaign_id: UUID,
+        days: int = 30,
+        conversions_limit: int = 100
+    ) -> Dict[str, Any]:
+        """
+        Get analytics (including metrics) and recent conversions in one call.
+
+        Args:
+            campaign_id: Campaign UUID
+            days: Number of days for time-series data
+            conversions_limit: Maximum number of conversions to return
+
+        Returns:
+            Analytics data plus the first page of conversions and their total
+        """
+        analytics = self.get_campaign_analytics(campaign_id, days)
+        conversions, total = self.get_campaign_conversions(campaign_id, limit=conversions_limit)
+
+        return {
+            **analytics,
+            "conversions": conversions,
+            "conversions_total": total
+        }
+
     def get_campaign_statistics(
         self,
         owner_id: Optional[UUID] = None
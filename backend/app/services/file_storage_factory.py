@@ -5,9 +5,12 @@ File storage factory for handling different storage backends.
 import os
 import uuid
 import logging
-from typing import Protocol, Union
+from typing import Protocol, Union, TYPE_CHECKING
 from fastapi import HTTPException, status
-from .azure_blob_service import AzureBlobStorageService
+
+if TYPE_CHECKING:
+    # The Azure SDK is only imported when the azure_blob backend is selected
+    from .azure_blob_service import AzureBlobStorageService
 
 logger = logging.getLogger(__name__)
 
@@ -146,7 +149,7 @@ class FileStorageFactory:
     def get_storage_service(
         storage_backend: str = "local",
         **kwargs
-    ) -> Union[LocalFileStorage, AzureBlobStorageService]:
+    ) -> Union[LocalFileStorage, "AzureBlobStorageService"]:
         """
         Get the appropriate storage service based on configuration.
 
@@ -175,6 +178,8 @@ class FileStorageFactory:
                     detail="Cloud storage configuration missing"
                 )
 
+            from .azure_blob_service import AzureBlobStorageService
+
             return AzureBlobStorageService(
                 account_name=account_name,
                 account_key=account_key,
@@ -195,7 +200,7 @@ class FileStorageFactory:
 
 
 # Dependency function for FastAPI
-def get_file_storage_service() -> Union[LocalFileStorage, AzureBlobStorageService]:
+def get_file_storage_service() -> Union[LocalFileStorage, "AzureBlobStorageService"]:
     """Get the configured file storage service."""
     from ..core.config import settings
 
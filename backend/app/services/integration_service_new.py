@@ -7,6 +7,7 @@ import os
 from typing import Dict, Any, Optional, List
 from datetime import datetime, timedelta
 from uuid import UUID
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 
 from ..repositories.integration_repository import (
@@ -249,6 +250,14 @@ class IntegrationService:
 
         return updated
 
+    def get_integration_version(
+        self,
+        integration_id: UUID,
+        user_id: UUID
+    ) -> Optional[Row]:
+        """Get an owned integration's updated_at without loading the row."""
+        return self.repository.get_version_for_user(integration_id, user_id)
+
     def delete_integration(
         self,
         integration_id: UUID,
@@ -264,24 +273,9 @@ class IntegrationService:
         Returns:
             True if deleted, False if not found
         """
-        integration = self.get_integration_by_id(integration_id, user_id)
-        if not integration:
-            return False
-
-        # Disconnect first if connected
-        if integration.status == 'connected':
-            self.disconnect_integration(integration_id, user_id)
-
-        # Log deletion
-        self.log_repository.create_log(
-            integration_id,
-            'delete',
-            'success',
-            f"Integration deleted for {integration.provider}"
-        )
-
-        # Delete integration (cascades to logs and webhooks)
-        return self.repository.delete(integration_id)
+        # Logs and webhooks go with the integration, so there is nothing to
+        # disconnect or log first; ownership is part of the DELETE itself
+        return self.repository.delete_for_user(integration_id, user_id)
 
     def connect_integration(
         self,
@@ -334,7 +328,7 @@ class IntegrationService:
         self,
         integration_id: UUID,
         user_id: UUID
-    ) -> Optional[Integration]:
+    ) -> bool:
         """
         Disconnect an integration.
 
@@ -343,30 +337,22 @@ class IntegrationService:
             user_id: User UUID
 
         Returns:
-            Disconnected integration or None
+            True if disconnected, False if not found
         """
-        integration = self.get_integration_by_id(integration_id, user_id)
-        if not integration:
-            return None
-
-        # Clear tokens and update status
-        integration.access_token = None
-        integration.refresh_token = None
-        integration.expires_at = None
-        integration.last_error = None
-        integration.error_count = "0"
-
-        updated = self.repository.update_status(integration_id, 'disconnected')
+        # Clear tokens and update status in one ownership-checked UPDATE
+        provider = self.repository.disconnect_for_user(integration_id, user_id)
+        if provider is None:
+            return False
 
         # Log disconnection
         self.log_repository.create_log(
             integration_id,
             'disconnect',
             'success',
-            f"Disconnected from {integration.provider}"
+            f"Disconnected from {provider}"
         )
 
-        return updated
+        return True
 
     def test_connection(
         self,
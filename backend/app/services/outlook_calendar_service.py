@@ -4,7 +4,6 @@ Handles interaction with Microsoft Graph Calendar API for calendar event managem
 """
 
 import httpx
-import json
 from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
@@ -324,7 +323,7 @@ class OutlookCalendarService:
             'end_time': end_time,
             'location': location,
             'meeting_link': meeting_link,
-            'attendees': json.dumps(attendees) if attendees else None,
+            'attendees': attendees or None,
             'outlook_event_id': event.get('id'),
             'sync_source': 'outlook',
             'sync_status': 'synced',
@@ -375,19 +374,15 @@ class OutlookCalendarService:
 
         # Add attendees if specified
         if activity.attendees:
-            try:
-                attendee_emails = json.loads(activity.attendees)
-                event_data['attendees'] = [
-                    {
-                        'emailAddress': {
-                            'address': email
-                        },
-                        'type': 'required'
-                    }
-                    for email in attendee_emails
-                ]
-            except json.JSONDecodeError:
-                pass
+            event_data['attendees'] = [
+                {
+                    'emailAddress': {
+                        'address': email
+                    },
+                    'type': 'required'
+                }
+                for email in activity.attendees
+            ]
 
         return event_data
 
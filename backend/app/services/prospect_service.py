@@ -6,6 +6,7 @@ Handles prospect CRUD, duplicate detection, conversion workflow, and lead scorin
 from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from datetime import datetime
+from sqlalchemy import Row
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -92,6 +93,18 @@ class ProspectService:
         """Get a prospect by ID."""
         return self.repository.get(prospect_id)
 
+    def get_prospect_for_user(self, prospect_id: UUID, user_id: UUID) -> Optional[Prospect]:
+        """Get a prospect by ID if it is assigned to the user."""
+        return self.repository.get_for_assignee(prospect_id, user_id)
+
+    def get_prospect_version_for_user(self, prospect_id: UUID, user_id: UUID) -> Optional[Row]:
+        """Get an assigned prospect's updated_at without loading the row."""
+        return self.repository.get_version_for_assignee(prospect_id, user_id)
+
+    def prospect_exists(self, prospect_id: UUID) -> bool:
+        """Check whether a prospect exists."""
+        return self.repository.exists(prospect_id)
+
     def get_prospects(
         self,
         filters: ProspectFilter,
@@ -119,6 +132,33 @@ class ProspectService:
             limit=limit
         )
 
+    def get_prospects_page(
+        self,
+        filters: ProspectFilter,
+        skip: int = 0,
+        limit: int = 100
+    ) -> Tuple[List[Prospect], bool]:
+        """
+        Get a page of prospects without computing the total count.
+
+        Args:
+            filters: Filter criteria
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            Tuple of (prospects list, whether more records follow)
+        """
+        filter_dict = filters.dict(exclude_none=True)
+        search_term = filter_dict.pop('search', '')
+
+        return self.repository.search_page(
+            search_term=search_term,
+            filters=filter_dict,
+            skip=skip,
+            limit=limit
+        )
+
     def get_campaign_prospects(
         self,
         campaign_id: UUID,
@@ -142,7 +182,8 @@ class ProspectService:
         self,
         prospect_id: UUID,
         prospect_data: ProspectUpdate,
-        updated_by: Optional[UUID] = None
+        updated_by: Optional[UUID] = None,
+        prospect: Optional[Prospect] = None
     ) -> Optional[Prospect]:
         """
         Update a prospect.
@@ -151,6 +192,7 @@ class ProspectService:
             prospect_id: Prospect UUID
             prospect_data: Update data
             updated_by: User ID performing the update (for conversion tracking)
+            prospect: Already-loaded prospect, to avoid fetching it again
 
         Returns:
             Updated prospect or None if not found
@@ -158,7 +200,8 @@ class ProspectService:
         Raises:
             HTTPException: If duplicate email/phone found or conversion fails
         """
-        prospect = self.repository.get(prospect_id)
+        if prospect is None:
+            prospect = self.repository.get(prospect_id)
         if not prospect:
             return None
 
@@ -212,7 +255,8 @@ class ProspectService:
                 self.convert_to_contact(
                     prospect_id=prospect_id,
                     conversion_request=conversion_request,
-                    converted_by=updated_by or prospect.assigned_to or prospect.created_by
+                    converted_by=updated_by or prospect.assigned_to or prospect.created_by,
+                    prospect=prospect
                 )
 
                 # Return the updated prospect (conversion updates it internally)
@@ -227,11 +271,16 @@ class ProspectService:
         """Delete a prospect."""
         return self.repository.delete(id=prospect_id)
 
+    def delete_prospect_for_user(self, prospect_id: UUID, user_id: UUID) -> bool:
+        """Delete a prospect if it is assigned to the user, in a single statement."""
+        return self.repository.delete_for_assignee(prospect_id, user_id)
+
     def convert_to_contact(
         self,
         prospect_id: UUID,
         conversion_request: ProspectConversionRequest,
-        converted_by: UUID
+        converted_by: UUID,
+        prospect: Optional[Prospect] = None
     ) -> Dict[str, Any]:
         """
         Convert a prospect to a contact.
@@ -240,6 +289,7 @@ class ProspectService:
             prospect_id: Prospect UUID
             conversion_request: Conversion parameters
             converted_by: User ID performing the conversion
+            prospect: Already-loaded prospect, to avoid fetching it again
 
         Returns:
             Dictionary with prospect_id, contact_id, and optionally activity_id
@@ -247,7 +297,8 @@ class ProspectService:
         Raises:
             HTTPException: If prospect not found or already converted
         """
-        prospect = self.repository.get(prospect_id)
+        if prospect is None:
+            prospect = self.repository.get(prospect_id)
         if not prospect:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -413,6 +464,12 @@ class ProspectService:
             prospect_dict = prospect_create.dict(exclude_unset=True)
             prospect_dict['created_by'] = created_by
 
+            # Convert empty strings to None for unique fields to avoid constraint violations
+            if prospect_dict.get('phone') == '':
+                prospect_dict['phone'] = None
+            if prospect_dict.get('email') == '':
+                prospect_dict['email'] = None
+
             # Set campaign_id if provided at bulk level
             if bulk_data.campaign_id and 'campaign_id' not in prospect_dict:
                 prospect_dict['campaign_id'] = bulk_data.campaign_id
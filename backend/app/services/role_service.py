@@ -3,13 +3,14 @@ Role Service - Business logic layer for Role and Permission operations.
 Handles RBAC (Role-Based Access Control) business rules.
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from uuid import UUID
 from sqlalchemy.orm import Session
 
 from ..repositories.role_repository import RoleRepository, PermissionRepository
 from ..models.role import Role, Permission
 from ..schemas.role import RoleCreate, RoleUpdate
+from ..core.auth import invalidate_role_permissions
 
 
 class RoleService:
@@ -114,6 +115,7 @@ class RoleService:
                 role_data.permission_ids
             )
 
+        invalidate_role_permissions()
         return created_role
 
     def update_role(self, role_id: UUID, role_data: RoleUpdate) -> Optional[Role]:
@@ -149,6 +151,7 @@ class RoleService:
                 role_data.permission_ids
             )
 
+        invalidate_role_permissions()
         return updated_role
 
     def delete_role(self, role_id: UUID) -> bool:
@@ -177,6 +180,7 @@ class RoleService:
         # Soft delete
         update_data = {'is_active': False}
         self.repository.update(db_obj=role, obj_in=update_data)
+        invalidate_role_permissions()
 
         return True
 
@@ -201,7 +205,7 @@ class RoleService:
         self,
         role_name: str,
         permission_changes: Dict[str, bool]
-    ) -> Optional[Role]:
+    ) -> Optional[Tuple[Role, List[str]]]:
         """
         Update role permissions using permission names.
 
@@ -210,16 +214,19 @@ class RoleService:
             permission_changes: Dict of permission_name -> enabled/disabled
 
         Returns:
-            Updated role or None
+            Tuple of (updated role, granted permission names) or None
         """
         role = self.get_role_by_name(role_name)
 
         if not role:
             return None
 
-        return self.repository.update_permissions_by_name(role, permission_changes)
+        updated_role = self.repository.update_permissions_by_name(role, permission_changes)
+        invalidate_role_permissions()
+
+        return updated_role, self.repository.get_permission_names(updated_role.id)
 
-    def restore_default_permissions(self, role_name: str) -> Optional[Role]:
+    def restore_default_permissions(self, role_name: str) -> Optional[Tuple[Role, List[str]]]:
         """
         Restore default permissions for a role.
 
@@ -227,7 +234,7 @@ class RoleService:
             role_name: Role name (display or internal)
 
         Returns:
-            Updated role or None
+            Tuple of (updated role, granted permission names) or None
         """
         from ..seeds.permissions_seed import get_default_role_permissions
 
@@ -240,12 +247,14 @@ class RoleService:
         default_permissions = get_default_role_permissions()
         permission_names = default_permissions.get(role.name, [])
 
-        # Get permission objects
-        permissions = self.permission_repository.get_by_names(permission_names)
-        permission_ids = [p.id for p in permissions]
+        # Set permissions by name (inactive permissions are skipped)
+        updated_role = self.repository.update_permissions_by_name(
+            role,
+            {name: True for name in permission_names}
+        )
+        invalidate_role_permissions()
 
-        # Set permissions
-        return self.repository.set_role_permissions(role, permission_ids)
+        return updated_role, self.repository.get_permission_names(updated_role.id)
 
     def get_role_statistics(self) -> Dict[str, int]:
         """
@@ -123,6 +123,51 @@ class TaskService:
         """
         return self.repository.delete(id=task_id)
 
+    def task_exists(self, task_id: UUID) -> bool:
+        """
+        Check whether a task exists, regardless of assignee.
+
+        Args:
+            task_id: Task UUID
+
+        Returns:
+            True if the task exists
+        """
+        return self.repository.exists(task_id)
+
+    def update_task_for_user(
+        self,
+        task_id: UUID,
+        user_id: UUID,
+        task_data: TaskUpdate
+    ) -> Optional[Task]:
+        """
+        Update a task assigned to the given user, with ownership checked in SQL.
+
+        Args:
+            task_id: Task UUID
+            user_id: Assignee UUID
+            task_data: Update data
+
+        Returns:
+            Updated task or None if no assigned task matched
+        """
+        update_data = task_data.model_dump(exclude_unset=True)
+        return self.repository.update_for_assignee(task_id, user_id, update_data)
+
+    def delete_task_for_user(self, task_id: UUID, user_id: UUID) -> bool:
+        """
+        Delete a task assigned to the given user, with ownership checked in SQL.
+
+        Args:
+            task_id: Task UUID
+            user_id: Assignee UUID
+
+        Returns:
+            True if deleted, False if no assigned task matched
+        """
+        return self.repository.delete_for_assignee(task_id, user_id)
+
     def get_task_statistics(self, user_id: UUID) -> Dict[str, Any]:
         """
         Get task statistics for a user.
@@ -177,17 +222,18 @@ class TaskService:
         """
         return self.repository.get_upcoming_tasks(user_id, days)
 
-    def get_tasks_by_contact(self, contact_id: UUID) -> List[Task]:
+    def get_tasks_by_contact_for_user(self, contact_id: UUID, user_id: UUID) -> List[Task]:
         """
-        Get all tasks related to a contact.
+        Get a contact's tasks that the user is assigned to or created.
 
         Args:
             contact_id: Contact UUID
+            user_id: User UUID
 
         Returns:
             List of tasks
         """
-        return self.repository.get_tasks_by_contact(contact_id)
+        return self.repository.get_tasks_by_contact_for_user(contact_id, user_id)
 
     def get_created_tasks(
         self,
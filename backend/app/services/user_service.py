@@ -15,6 +15,7 @@ from ..schemas.user import UserCreate, UserUpdate, UserInvite
 from ..core.security import get_password_hash, verify_password
 from ..services.smtp_service import SMTPService
 from ..core.config import settings
+from ..core.auth import invalidate_cached_user
 
 
 class UserService:
@@ -299,6 +300,7 @@ class UserService:
 
         # Update user
         updated_user = self.repository.update(db_obj=user, obj_in=update_data)
+        invalidate_cached_user(user_id)
 
         return updated_user
 
@@ -325,6 +327,7 @@ class UserService:
         }
 
         updated_user = self.repository.update(db_obj=user, obj_in=update_data)
+        invalidate_cached_user(user.id)
 
         return updated_user
 
@@ -355,6 +358,7 @@ class UserService:
         # Hash and update password
         hashed_password = get_password_hash(new_password)
         updated_user = self.repository.update_password(user, hashed_password)
+        invalidate_cached_user(user.id)
 
         return updated_user
 
@@ -376,6 +380,7 @@ class UserService:
 
         hashed_password = get_password_hash(new_password)
         updated_user = self.repository.update_password(user, hashed_password)
+        invalidate_cached_user(user_id)
 
         return updated_user
 
@@ -389,7 +394,9 @@ class UserService:
         Returns:
             Updated user or None
         """
-        return self.repository.deactivate_user(user_id)
+        user = self.repository.deactivate_user(user_id)
+        invalidate_cached_user(user_id)
+        return user
 
     def activate_user(self, user_id: UUID) -> Optional[UserProfile]:
         """
@@ -401,7 +408,9 @@ class UserService:
         Returns:
             Updated user or None
         """
-        return self.repository.activate_user(user_id)
+        user = self.repository.activate_user(user_id)
+        invalidate_cached_user(user_id)
+        return user
 
     def get_user_statistics(self) -> Dict[str, Any]:
         """
@@ -534,6 +543,7 @@ class UserService:
         user.auth_provider = "microsoft"
 
         self.db.commit()
+        invalidate_cached_user(user.id)
         self.db.refresh(user)
 
         print(f"✅ Linked Microsoft account to user: {user.email}")
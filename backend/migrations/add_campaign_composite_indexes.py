@@ -0,0 +1,54 @@
+"""Add composite indexes for campaign audience and metrics queries
+
+Campaign audience, status-filtered audience, duplicate-recipient checks and
+performance history all filter on campaign_id first. These composite
+indexes let each of those queries use a single index scan:
+- campaign_contacts (campaign_id, status)
+- campaign_contacts (campaign_id, created_at)
+- campaign_contacts (campaign_id, contact_id)
+- campaign_contacts (campaign_id, prospect_id)
+- campaign_metrics (campaign_id, recorded_at)
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import engine
+from sqlalchemy import text
+
+INDEXES = [
+    ("ix_campaign_contacts_campaign_status", "campaign_contacts", "campaign_id, status"),
+    ("ix_campaign_contacts_campaign_created", "campaign_contacts", "campaign_id, created_at"),
+    ("ix_campaign_contacts_campaign_contact", "campaign_contacts", "campaign_id, contact_id"),
+    ("ix_campaign_contacts_campaign_prospect", "campaign_contacts", "campaign_id, prospect_id"),
+    ("ix_campaign_metrics_campaign_recorded", "campaign_metrics", "campaign_id, recorded_at"),
+]
+
+
+def upgrade():
+    """Create the composite indexes"""
+    with engine.connect() as conn:
+        for name, table, columns in INDEXES:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns});"))
+
+        conn.commit()
+        print("✅ Successfully added campaign composite indexes")
+
+
+def downgrade():
+    """Drop the composite indexes"""
+    with engine.connect() as conn:
+        for name, _, _ in INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name};"))
+
+        conn.commit()
+        print("✅ Successfully removed campaign composite indexes")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add campaign composite indexes")
+    upgrade()
+    print("Migration completed successfully!")
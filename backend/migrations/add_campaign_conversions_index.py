@@ -0,0 +1,46 @@
+"""Add a partial index for campaign conversion listings
+
+Campaign conversions are read as "converted recipients of one campaign,
+newest conversion first". Only a small share of recipients ever convert,
+so a partial index over just those rows stays small and serves both the
+filter and the ORDER BY converted_at DESC.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import engine
+from sqlalchemy import text
+
+
+def upgrade():
+    """Create the partial conversions index"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_campaign_contacts_campaign_converted
+            ON campaign_contacts (campaign_id, converted_at)
+            WHERE converted_at IS NOT NULL;
+        """))
+
+        conn.commit()
+        print("✅ Successfully added ix_campaign_contacts_campaign_converted index")
+
+
+def downgrade():
+    """Drop the partial conversions index"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_campaign_contacts_campaign_converted;
+        """))
+
+        conn.commit()
+        print("✅ Successfully removed ix_campaign_contacts_campaign_converted index")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add campaign conversions index")
+    upgrade()
+    print("Migration completed successfully!")
@@ -0,0 +1,65 @@
+"""Add a unique (campaign_id, recipient) index on campaign_contacts
+
+A campaign recipient is either a contact or a prospect, never both. Indexing
+COALESCE(contact_id, prospect_id) lets "is this recipient already in the
+campaign?" be answered by one index probe. The index is unique, so the
+database rejects duplicates even when two requests add the same recipient
+at once.
+
+The old check-then-insert could race, so duplicate recipients may already
+exist. They are deleted first, keeping the earliest row per recipient, so
+that CREATE UNIQUE INDEX can succeed.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import engine
+from sqlalchemy import text
+
+
+def upgrade():
+    """Remove duplicate recipients and create the unique recipient index"""
+    with engine.connect() as conn:
+        result = conn.execute(text("""
+            DELETE FROM campaign_contacts
+            WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (
+                        PARTITION BY campaign_id, COALESCE(contact_id, prospect_id)
+                        ORDER BY created_at, id
+                    ) AS position
+                    FROM campaign_contacts
+                ) ranked
+                WHERE position > 1
+            );
+        """))
+        print(f"✅ Removed {result.rowcount} duplicate campaign recipients")
+
+        conn.execute(text("""
+            CREATE UNIQUE INDEX IF NOT EXISTS ix_campaign_contacts_campaign_recipient
+            ON campaign_contacts (campaign_id, COALESCE(contact_id, prospect_id));
+        """))
+
+        conn.commit()
+        print("✅ Successfully added ix_campaign_contacts_campaign_recipient index")
+
+
+def downgrade():
+    """Drop the unique recipient index"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_campaign_contacts_campaign_recipient;
+        """))
+
+        conn.commit()
+        print("✅ Successfully removed ix_campaign_contacts_campaign_recipient index")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add unique campaign recipient index")
+    upgrade()
+    print("Migration completed successfully!")
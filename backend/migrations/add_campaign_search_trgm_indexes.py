@@ -0,0 +1,55 @@
+"""Add trigram indexes for campaign name/description search
+
+Campaign search matches ILIKE '%term%' against name and description, which
+Postgres can only answer with a sequential scan on a plain btree. pg_trgm
+GIN indexes serve the same ILIKE patterns from an index, so search keeps
+its substring semantics (partial words still match) without scanning the
+whole table.
+
+These indexes are not declared on the model because they need the pg_trgm
+extension, which create_all cannot enable.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import engine
+from sqlalchemy import text
+
+
+def upgrade():
+    """Enable pg_trgm and create the trigram indexes"""
+    with engine.connect() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_campaigns_name_trgm
+            ON campaigns USING GIN (name gin_trgm_ops);
+        """))
+
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_campaigns_description_trgm
+            ON campaigns USING GIN (description gin_trgm_ops);
+        """))
+
+        conn.commit()
+        print("✅ Successfully added campaign search trigram indexes")
+
+
+def downgrade():
+    """Drop the trigram indexes (the extension is left installed)"""
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_campaigns_name_trgm;"))
+        conn.execute(text("DROP INDEX IF EXISTS ix_campaigns_description_trgm;"))
+
+        conn.commit()
+        print("✅ Successfully removed campaign search trigram indexes")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add campaign search trigram indexes")
+    upgrade()
+    print("Migration completed successfully!")
@@ -0,0 +1,44 @@
+"""Add an index on tasks.contact_id
+
+The contact detail page lists a contact's tasks filtered to the ones the
+current user is assigned to or created. This index lets that lookup start
+from the contact instead of scanning the tasks table.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import engine
+from sqlalchemy import text
+
+
+def upgrade():
+    """Create the tasks.contact_id index"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_tasks_contact_id
+            ON tasks (contact_id);
+        """))
+
+        conn.commit()
+        print("✅ Successfully added ix_tasks_contact_id index")
+
+
+def downgrade():
+    """Drop the tasks.contact_id index"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            DROP INDEX IF EXISTS ix_tasks_contact_id;
+        """))
+
+        conn.commit()
+        print("✅ Successfully removed ix_tasks_contact_id index")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add tasks.contact_id index")
+    upgrade()
+    print("Migration completed successfully!")
@@ -0,0 +1,56 @@
+"""Store activities.attendees as JSONB
+
+attendees held a JSON array serialized into a TEXT column, so every reader
+had to json.loads it in Python. API-created rows held Postgres array
+literals instead; both shapes are converted to JSON arrays. As JSONB the
+driver hands back a list and Postgres can filter on the array directly.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.database import engine
+from sqlalchemy import text
+
+
+def upgrade():
+    """Convert activities.attendees from TEXT to JSONB"""
+    with engine.connect() as conn:
+        # Rows written by the calendar sync hold JSON arrays, but activities
+        # created through the API stored Postgres array literals such as
+        # {john@acme.com}. Convert both; anything else was already dropped
+        # as undecodable by ActivityResponse.parse_attendees.
+        conn.execute(text(r"""
+            ALTER TABLE activities
+            ALTER COLUMN attendees TYPE jsonb
+            USING CASE
+                WHEN attendees ~ '^\s*\[' THEN attendees::jsonb
+                WHEN attendees ~ '^\s*\{' THEN to_jsonb(attendees::text[])
+                ELSE NULL
+            END;
+        """))
+
+        conn.commit()
+        print("✅ Successfully converted activities.attendees to JSONB")
+
+
+def downgrade():
+    """Convert activities.attendees back to TEXT"""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            ALTER TABLE activities
+            ALTER COLUMN attendees TYPE text
+            USING attendees::text;
+        """))
+
+        conn.commit()
+        print("✅ Successfully converted activities.attendees back to TEXT")
+
+
+if __name__ == "__main__":
+    print("Running migration: Convert activities.attendees to JSONB")
+    upgrade()
+    print("Migration completed successfully!")